@@ -1,7 +1,6 @@
 #!/usr/bin/env python3
 """Run the Azure Translation Service application."""
 
-import uvicorn
 from src.config.env import get_settings
 
 if __name__ == "__main__":
@@ -14,6 +13,9 @@ if __name__ == "__main__":
     print(f"Post-Editor: {'Enabled' if settings.enable_post_editor else 'Disabled'}")
     print()
     
+    # Imported after the banner so startup output appears immediately
+    import uvicorn
+    
     uvicorn.run(
         "src.app:app",
         host=settings.host,
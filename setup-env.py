@@ -6,8 +6,15 @@ A cross-platform Python script for automating environment configuration.
 
 import os
 import sys
+import re
 import json
+import time
+import shutil
+import hashlib
+import datetime
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Tuple, Dict
 import argparse
@@ -53,14 +60,48 @@ def print_info(text: str):
     print(f"{Colors.CYAN}ℹ {text}{Colors.END}")
 
 
+# Environment passed to every subprocess (None inherits os.environ)
+COMMAND_ENV: Optional[Dict[str, str]] = None
+
+
+def build_command_env() -> Dict[str, str]:
+    """Build a subprocess environment that keeps az CLI overhead low"""
+    env = os.environ.copy()
+    env.setdefault('AZURE_CORE_COLLECT_TELEMETRY', 'no')
+    env.setdefault('AZURE_CORE_OUTPUT', 'json')
+    return env
+
+
+# Commands that call Microsoft Graph and therefore need a Graph token
+GRAPH_COMMAND_PREFIXES = (['az', 'ad'], ['az', 'rest'])
+
+
+@lru_cache(maxsize=1)
+def warm_graph_token() -> None:
+    """Acquire a Microsoft Graph token once so the MSAL token cache is warm
+    
+    Called lazily before the first Graph command, so runs whose Graph
+    lookups are all served from the on-disk cache never fetch a token.
+    """
+    run_command([
+        'az', 'account', 'get-access-token',
+        '--resource', 'https://graph.microsoft.com/',
+        '-o', 'none'
+    ], check=False)
+
+
 def run_command(cmd: list, check: bool = True) -> Tuple[int, str, str]:
     """Execute a shell command and return result"""
+    if cmd[:2] in GRAPH_COMMAND_PREFIXES:
+        warm_graph_token()
+    
     try:
         result = subprocess.run(
             cmd,
             capture_output=True,
             text=True,
-            check=check
+            check=check,
+            env=COMMAND_ENV
         )
         return result.returncode, result.stdout.strip(), result.stderr.strip()
     except subprocess.CalledProcessError as e:
@@ -69,13 +110,70 @@ def run_command(cmd: list, check: bool = True) -> Tuple[int, str, str]:
         return 1, "", str(e)
 
 
+CACHE_DIR = Path.home() / '.cache' / 'azure-translation-setup'
+CACHE_ENABLED = True
+
+# Cache lifetime (seconds) for read-only az account queries. Azure AD
+# lookups are never cached: they decide whether an app or service principal
+# is created, and objects can be deleted in the portal at any time
+ACCOUNT_CACHE_TTL = 60 * 60
+
+
+def azure_profile_stamp() -> Optional[str]:
+    """Return a stamp that changes whenever the active Azure account changes
+    
+    'az login', 'az logout' and 'az account set' all rewrite azureProfile.json,
+    so its modification time identifies the login state. Returns None if the
+    profile cannot be read.
+    """
+    config_dir = os.environ.get('AZURE_CONFIG_DIR') or Path.home() / '.azure'
+    try:
+        return str((Path(config_dir) / 'azureProfile.json').stat().st_mtime_ns)
+    except OSError:
+        return None
+
+
+def run_cached_command(cmd: list, ttl: int, check: bool = True) -> Tuple[int, str, str]:
+    """Execute a read-only command, reusing a recent successful result from disk
+    
+    Results are only reused while the Azure login state is unchanged.
+    """
+    profile_stamp = azure_profile_stamp() if CACHE_ENABLED else None
+    if profile_stamp is None:
+        return run_command(cmd, check=check)
+    
+    key = hashlib.sha1('\0'.join([profile_stamp, *cmd]).encode('utf-8')).hexdigest()
+    cache_file = CACHE_DIR / f"{key}.json"
+    
+    try:
+        if time.time() - cache_file.stat().st_mtime < ttl:
+            cached = json.loads(cache_file.read_text(encoding='utf-8'))
+            return 0, cached['stdout'], cached['stderr']
+    except (OSError, ValueError, KeyError):
+        pass
+    
+    code, stdout, stderr = run_command(cmd, check=check)
+    
+    # Only successful lookups are cached; failures are retried next run
+    if code == 0 and stdout:
+        try:
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            cache_file.write_text(
+                json.dumps({'stdout': stdout, 'stderr': stderr}),
+                encoding='utf-8'
+            )
+        except OSError:
+            pass
+    
+    return code, stdout, stderr
+
+
 def check_command(cmd: str) -> bool:
     """Check if a command is available in PATH"""
-    code, _, _ = run_command(['which', cmd], check=False)
-    return code == 0
+    return shutil.which(cmd) is not None
 
 
-def check_prerequisites() -> bool:
+def check_prerequisites(executor: ThreadPoolExecutor) -> bool:
     """Check if required tools are installed"""
     print_header("Checking Prerequisites")
     
@@ -85,16 +183,27 @@ def check_prerequisites() -> bool:
         'git': 'Git (https://git-scm.com)',
     }
     
+    # Probe tools and Azure login concurrently; report in a fixed order
+    login_check = executor.submit(
+        run_cached_command,
+        ['az', 'account', 'show', '-o', 'json'],
+        ACCOUNT_CACHE_TTL,
+        check=False
+    )
+    tool_checks = {
+        cmd: executor.submit(check_command, cmd) for cmd in required
+    }
+    
     all_present = True
     for cmd, description in required.items():
-        if check_command(cmd):
+        if tool_checks[cmd].result():
             print_success(f"{cmd} found")
         else:
             print_error(f"{cmd} not found: {description}")
             all_present = False
     
     # Check Azure login
-    code, _, _ = run_command(['az', 'account', 'show'], check=False)
+    code, _, _ = login_check.result()
     if code == 0:
         print_success("Azure login verified")
     else:
@@ -108,30 +217,20 @@ def get_azure_info() -> Dict[str, str]:
     """Retrieve Azure subscription information"""
     print_header("Retrieving Azure Account Information")
     
-    # Get subscription ID
-    code, subscription_id, _ = run_command([
-        'az', 'account', 'show',
-        '--query', 'id',
-        '-o', 'tsv'
-    ])
+    # Read subscription ID, tenant ID and account name in a single call
+    code, output, _ = run_cached_command(
+        ['az', 'account', 'show', '-o', 'json'],
+        ACCOUNT_CACHE_TTL
+    )
     
     if code != 0:
         print_error("Could not retrieve subscription ID")
         sys.exit(1)
     
-    # Get tenant ID
-    code, tenant_id, _ = run_command([
-        'az', 'account', 'show',
-        '--query', 'tenantId',
-        '-o', 'tsv'
-    ])
-    
-    # Get account name
-    code, account_name, _ = run_command([
-        'az', 'account', 'show',
-        '--query', 'name',
-        '-o', 'tsv'
-    ])
+    account = json.loads(output)
+    subscription_id = account.get('id', '')
+    tenant_id = account.get('tenantId', '')
+    account_name = account.get('name', '')
     
     print_success(f"Subscription: {account_name}")
     print_info(f"Subscription ID: {subscription_id}")
@@ -175,17 +274,29 @@ def setup_azure_ad_app(app_name: str = "GitHub-YOUR-REPO-NAME") -> str:
     else:
         print_info(f"Using existing app: {client_id}")
     
-    # Create Service Principal
-    print_info("Creating Service Principal...")
-    run_command(['az', 'ad', 'sp', 'create', '--id', client_id], check=False)
-    
-    # Get Service Principal Object ID
+    # Reuse the existing Service Principal if there is one; otherwise create
+    # it and read its Object ID from the create response
     code, sp_object_id, _ = run_command([
         'az', 'ad', 'sp', 'show',
         '--id', client_id,
         '--query', 'id',
         '-o', 'tsv'
-    ])
+    ], check=False)
+    
+    if code != 0 or not sp_object_id:
+        print_info("Creating Service Principal...")
+        code, sp_object_id, _ = run_command([
+            'az', 'ad', 'sp', 'create',
+            '--id', client_id,
+            '--query', 'id',
+            '-o', 'tsv'
+        ])
+        
+        if code != 0:
+            print_error("Could not create Service Principal")
+            sys.exit(1)
+    else:
+        print_info(f"Using existing Service Principal: {sp_object_id}")
     
     return client_id, sp_object_id
 
@@ -213,8 +324,70 @@ def setup_role_assignment(
         return False
 
 
+@lru_cache(maxsize=4)
+def list_federated_credentials(client_id: str) -> frozenset:
+    """Return the names of the app's existing federated credentials"""
+    _, output, _ = run_command([
+        'az', 'ad', 'app', 'federated-credential', 'list',
+        '--id', client_id,
+        '--query', '[].name',
+        '-o', 'tsv'
+    ], check=False)
+    
+    return frozenset(filter(None, output.splitlines()))
+
+
+def create_federated_credentials_batch(
+    client_id: str,
+    credentials: list
+) -> Optional[list]:
+    """Create federated credentials through a single Microsoft Graph $batch call
+    
+    Returns one status per credential (0 on success), or None if the batch
+    request itself could not be executed.
+    """
+    if not credentials:
+        return []
+    
+    batch = {
+        "requests": [
+            {
+                "id": str(i),
+                "method": "POST",
+                "url": f"/applications(appId='{client_id}')/federatedIdentityCredentials",
+                "headers": {"Content-Type": "application/json"},
+                "body": params
+            }
+            for i, (_, params) in enumerate(credentials)
+        ]
+    }
+    
+    code, output, _ = run_command([
+        'az', 'rest',
+        '--method', 'POST',
+        '--uri', 'https://graph.microsoft.com/v1.0/$batch',
+        '--headers', 'Content-Type=application/json',
+        '--body', json.dumps(batch)
+    ], check=False)
+    
+    if code != 0:
+        return None
+    
+    try:
+        responses = json.loads(output)['responses']
+        statuses = {int(r['id']): int(r['status']) for r in responses}
+    except (ValueError, KeyError, TypeError):
+        return None
+    
+    return [
+        0 if 200 <= statuses.get(i, 0) < 300 else 1
+        for i in range(len(credentials))
+    ]
+
+
 def setup_oidc_credentials(
     client_id: str,
+    executor: ThreadPoolExecutor,
     repo_owner: str = "YOUR_GITHUB_USERNAME",
     repo_name: str = "YOUR_REPO_NAME"
 ) -> bool:
@@ -223,69 +396,46 @@ def setup_oidc_credentials(
     
     # Get existing credentials
     print_info("Retrieving existing credentials...")
-    code, existing_output, _ = run_command([
-        'az', 'ad', 'app', 'federated-credential', 'list',
-        '--id', client_id,
-        '--query', '[].name',
-        '-o', 'tsv'
-    ], check=False)
-    
-    existing = set(existing_output.split('\n')) if existing_output else set()
-    
-    success = True
-    
-    # Setup environment credentials
-    for env in ['dev', 'staging', 'prod']:
-        cred_name = f"GitHub-{env}"
-        
+    existing = list_federated_credentials(client_id)
+    
+    subjects = [
+        (f"GitHub-{env}", f"environment:{env}", f"environment: {env}")
+        for env in ['dev', 'staging', 'prod']
+    ] + [
+        (f"GitHub-{branch}", f"ref:refs/heads/{branch}", f"branch: {branch}")
+        for branch in ['main', 'develop']
+    ]
+    
+    pending = []
+    for cred_name, subject, label in subjects:
         if cred_name in existing:
             print_info(f"Credential '{cred_name}' already exists, skipping...")
             continue
         
-        print_info(f"Creating credential for environment: {env}")
-        
-        params = {
+        print_info(f"Creating credential for {label}")
+        pending.append((cred_name, {
             "name": cred_name,
             "issuer": "https://token.actions.githubusercontent.com",
-            "subject": f"repo:{repo_owner}/{repo_name}:environment:{env}",
+            "subject": f"repo:{repo_owner}/{repo_name}:{subject}",
             "audiences": ["api://AzureADTokenExchange"]
-        }
+        }))
+    
+    # Create all missing credentials with one Graph $batch request; fall
+    # back to concurrent per-credential calls if the batch call fails
+    results = create_federated_credentials_batch(client_id, pending)
+    if results is None:
+        def create_credential(item):
+            _, params = item
+            return run_command([
+                'az', 'ad', 'app', 'federated-credential', 'create',
+                '--id', client_id,
+                '--parameters', json.dumps(params)
+            ], check=False)[0]
         
-        code, _, _ = run_command([
-            'az', 'ad', 'app', 'federated-credential', 'create',
-            '--id', client_id,
-            '--parameters', json.dumps(params)
-        ], check=False)
-        
-        if code == 0:
-            print_success(f"Created: {cred_name}")
-        else:
-            print_warning(f"Could not create: {cred_name}")
-            success = False
+        results = list(executor.map(create_credential, pending))
     
-    # Setup branch credentials
-    for branch in ['main', 'develop']:
-        cred_name = f"GitHub-{branch}"
-        
-        if cred_name in existing:
-            print_info(f"Credential '{cred_name}' already exists, skipping...")
-            continue
-        
-        print_info(f"Creating credential for branch: {branch}")
-        
-        params = {
-            "name": cred_name,
-            "issuer": "https://token.actions.githubusercontent.com",
-            "subject": f"repo:{repo_owner}/{repo_name}:ref:refs/heads/{branch}",
-            "audiences": ["api://AzureADTokenExchange"]
-        }
-        
-        code, _, _ = run_command([
-            'az', 'ad', 'app', 'federated-credential', 'create',
-            '--id', client_id,
-            '--parameters', json.dumps(params)
-        ], check=False)
-        
+    success = True
+    for (cred_name, _), code in zip(pending, results):
         if code == 0:
             print_success(f"Created: {cred_name}")
         else:
@@ -309,8 +459,7 @@ def create_env_file(env_file: Path) -> bool:
         print_error(f"Template file not found: {template_file}")
         return False
     
-    with open(template_file, 'r') as f:
-        env_content = f.read()
+    env_content = template_file.read_text(encoding='utf-8')
     
     # Prompt for values
     print_info("Enter Azure Translator information:")
@@ -328,38 +477,29 @@ def create_env_file(env_file: Path) -> bool:
         openai_key = input("  Azure OpenAI Key: ").strip()
     
     # Update template
-    env_content = env_content.replace(
-        "AZURE_TRANSLATOR_KEY=your_translator_key_here",
-        f"AZURE_TRANSLATOR_KEY={translator_key}"
-    )
-    env_content = env_content.replace(
-        "AZURE_TRANSLATOR_REGION=westeurope",
-        f"AZURE_TRANSLATOR_REGION={translator_region}"
-    )
-    env_content = env_content.replace(
-        "TARGET_LANGUAGE=nl",
-        f"TARGET_LANGUAGE={target_language}"
-    )
-    env_content = env_content.replace(
-        "ENABLE_POST_EDITOR=false",
-        f"ENABLE_POST_EDITOR={'true' if enable_post_editor else 'false'}"
-    )
-    
+    values = {
+        'AZURE_TRANSLATOR_KEY': translator_key,
+        'AZURE_TRANSLATOR_REGION': translator_region,
+        'TARGET_LANGUAGE': target_language,
+        'ENABLE_POST_EDITOR': 'true' if enable_post_editor else 'false',
+    }
     if openai_endpoint:
-        env_content = env_content.replace(
-            "AZURE_OPENAI_ENDPOINT=https://your-resource.openai.azure.com/",
-            f"AZURE_OPENAI_ENDPOINT={openai_endpoint}"
-        )
-    
+        values['AZURE_OPENAI_ENDPOINT'] = openai_endpoint
     if openai_key:
-        env_content = env_content.replace(
-            "AZURE_OPENAI_KEY=your_openai_key_here",
-            f"AZURE_OPENAI_KEY={openai_key}"
-        )
+        values['AZURE_OPENAI_KEY'] = openai_key
+    
+    # Rewrite all configured KEY=value lines in a single pass
+    pattern = re.compile(
+        r'^(' + '|'.join(map(re.escape, values)) + r')=.*$',
+        re.MULTILINE
+    )
+    env_content = pattern.sub(
+        lambda m: f"{m.group(1)}={values[m.group(1)]}",
+        env_content
+    )
     
     # Write file
-    with open(env_file, 'w') as f:
-        f.write(env_content)
+    env_file.write_text(env_content, encoding='utf-8')
     
     print_success("Created .env file")
     return True
@@ -368,7 +508,8 @@ def create_env_file(env_file: Path) -> bool:
 def setup_github_secrets(
     client_id: str,
     tenant_id: str,
-    subscription_id: str
+    subscription_id: str,
+    executor: ThreadPoolExecutor
 ) -> bool:
     """Setup GitHub repository secrets"""
     print_header("Setting Up GitHub Repository Secrets")
@@ -396,12 +537,16 @@ def setup_github_secrets(
         'AZURE_SUBSCRIPTION_ID': subscription_id,
     }
     
-    for key, value in secrets.items():
-        code, _, _ = run_command(
+    def set_secret(item):
+        key, value = item
+        return run_command(
             ['gh', 'secret', 'set', key, '--body', value],
             check=False
         )
-        
+    
+    results = list(executor.map(set_secret, secrets.items()))
+    
+    for key, (code, _, _) in zip(secrets, results):
         if code == 0:
             print_success(f"{key} set")
         else:
@@ -421,7 +566,7 @@ def generate_report(
     
     report = f"""# Environment Setup Report
 
-Generated: {subprocess.run(['date'], capture_output=True, text=True).stdout.strip()}
+Generated: {datetime.datetime.now().astimezone().strftime('%a %b %d %H:%M:%S %Z %Y')}
 
 ## Azure Account Information
 
@@ -479,8 +624,7 @@ For detailed deployment instructions, see:
 - GITHUB_SETUP.md - GitHub repository setup guide
 """
     
-    with open(report_file, 'w') as f:
-        f.write(report)
+    report_file.write_text(report, encoding='utf-8')
     
     print_success(f"Configuration report saved to SETUP_REPORT.md")
     print("\n" + report)
@@ -506,60 +650,75 @@ def main():
         action='store_true',
         help='Skip GitHub configuration'
     )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Bypass the on-disk cache of Azure CLI lookups'
+    )
     
     args = parser.parse_args()
     
-    print_header("Azure Translation Service - Environment Setup")
+    global CACHE_ENABLED, COMMAND_ENV
+    CACHE_ENABLED = not args.no_cache
+    COMMAND_ENV = build_command_env()
     
-    # Check prerequisites
-    if not args.skip_prerequisites and not check_prerequisites():
-        print_error("Prerequisites not met. Please install required tools.")
-        sys.exit(1)
-    
-    # Get Azure info
-    print()
-    azure_config = get_azure_info()
-    
-    # Setup Azure AD App
-    print()
-    client_id, sp_object_id = setup_azure_ad_app()
-    
-    # Setup role assignment
-    print()
-    setup_role_assignment(sp_object_id, azure_config['subscription_id'])
-    
-    # Setup OIDC
-    print()
-    setup_oidc_credentials(client_id)
-    
-    # Create .env file
-    if not args.skip_env_file:
+    # One worker pool shared by every stage that fans out CLI calls
+    executor = ThreadPoolExecutor(max_workers=8)
+    try:
+        print_header("Azure Translation Service - Environment Setup")
+        
+        # Check prerequisites
+        if not args.skip_prerequisites and not check_prerequisites(executor):
+            print_error("Prerequisites not met. Please install required tools.")
+            sys.exit(1)
+        
+        # Get Azure info
         print()
-        project_root = Path(__file__).parent
-        env_file = project_root / '.env'
-        create_env_file(env_file)
-    
-    # Setup GitHub
-    if not args.skip_github:
+        azure_config = get_azure_info()
+        
+        # Setup Azure AD App
         print()
-        setup_github_secrets(
-            client_id,
-            azure_config['tenant_id'],
-            azure_config['subscription_id']
-        )
-    
-    # Generate report
-    print()
-    config = {
-        **azure_config,
-        'client_id': client_id,
-        'sp_object_id': sp_object_id,
-        'env_file': str(Path(__file__).parent / '.env')
-    }
-    generate_report(Path(__file__).parent, config)
-    
-    print()
-    print_success("Setup completed successfully!")
+        client_id, sp_object_id = setup_azure_ad_app()
+        
+        # Setup role assignment
+        print()
+        setup_role_assignment(sp_object_id, azure_config['subscription_id'])
+        
+        # Setup OIDC
+        print()
+        setup_oidc_credentials(client_id, executor)
+        
+        # Create .env file
+        if not args.skip_env_file:
+            print()
+            project_root = Path(__file__).parent
+            env_file = project_root / '.env'
+            create_env_file(env_file)
+        
+        # Setup GitHub
+        if not args.skip_github:
+            print()
+            setup_github_secrets(
+                client_id,
+                azure_config['tenant_id'],
+                azure_config['subscription_id'],
+                executor
+            )
+        
+        # Generate report
+        print()
+        config = {
+            **azure_config,
+            'client_id': client_id,
+            'sp_object_id': sp_object_id,
+            'env_file': str(Path(__file__).parent / '.env')
+        }
+        generate_report(Path(__file__).parent, config)
+        
+        print()
+        print_success("Setup completed successfully!")
+    finally:
+        executor.shutdown()
 
 
 if __name__ == '__main__':
@@ -1,16 +1,27 @@
 """FastAPI application bootstrap."""
 
+import asyncio
+import logging
 from pathlib import Path
-from fastapi import FastAPI, Request
+from fastapi import FastAPI
 from fastapi.responses import HTMLResponse
 from fastapi.staticfiles import StaticFiles
-from fastapi.templating import Jinja2Templates
+from jinja2 import Environment, FileSystemLoader
 
 from .config.env import get_settings
 from .routes import translate
 from .routes import translate_preview
 
 
+# uvicorn only configures its own loggers; give the application's a handler
+package_logger = logging.getLogger(__package__)
+if not package_logger.handlers:
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter("%(levelname)s:     %(name)s - %(message)s"))
+    package_logger.addHandler(handler)
+    package_logger.setLevel(logging.INFO)
+logger = logging.getLogger(__name__)
+
 # Create FastAPI app
 app = FastAPI(
     title="Azure Translation Service",
@@ -20,7 +31,9 @@ app = FastAPI(
 
 # Setup templates
 templates_dir = Path(__file__).parent / "ui" / "templates"
-templates = Jinja2Templates(directory=str(templates_dir))
+# The UI is rendered once at startup without request-bound helpers,
+# so a plain Jinja environment is enough
+templates = Environment(loader=FileSystemLoader(str(templates_dir)), autoescape=True)
 
 # Include API routes
 app.include_router(translate.router)
@@ -30,8 +43,9 @@ app.include_router(translate_preview.router)
 @app.on_event("startup")
 async def startup_event():
     """Initialize services on startup."""
-    # Initialize standard translator
-    translate.initialize_services()
+    # Initialize standard translator (glossary loading is blocking file I/O,
+    # so run it off the event loop)
+    await asyncio.to_thread(translate.initialize_services)
     
     # Initialize preview translator with shared services
     translate_preview.initialize_preview_services(
@@ -40,31 +54,43 @@ async def startup_event():
         enforcer_instance=translate.terminology_enforcer
     )
     
-    print("Application started successfully")
-    print("Standard Translator: Available")
-    print(f"Preview Translator: {'Available' if translate_preview.preview_translator else 'Not configured'}")
+    # The UI only depends on startup configuration, so render it once
+    settings = get_settings()
+    app.state.index_html = templates.get_template("index.html").render(
+        target_language=settings.target_language,
+        post_editor_enabled=settings.enable_post_editor,
+        preview_available=translate_preview.preview_translator is not None
+    )
+    
+    logger.info("Application started successfully")
+    logger.info("Standard Translator: Available")
+    logger.info(
+        "Preview Translator: %s",
+        'Available' if translate_preview.preview_translator else 'Not configured'
+    )
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Release pooled HTTP connections on shutdown."""
+    if translate.translator_client:
+        await translate.translator_client.aclose()
+    if translate_preview.preview_translator:
+        await translate_preview.preview_translator.close()
+    if translate.post_editor:
+        await translate.post_editor.aclose()
 
 
 @app.get("/", response_class=HTMLResponse)
-async def index(request: Request):
+async def index():
     """Serve the main UI page.
     
-    Args:
-        request: FastAPI request object
-        
     Returns:
-        HTML response with translation UI
+        HTML response with translation UI (pre-rendered at startup)
     """
-    settings = get_settings()
-    
-    return templates.TemplateResponse(
-        "index.html",
-        {
-            "request": request,
-            "target_language": settings.target_language,
-            "post_editor_enabled": settings.enable_post_editor,
-            "preview_available": translate_preview.preview_translator is not None
-        }
+    return HTMLResponse(
+        app.state.index_html,
+        headers={"Cache-Control": "public, max-age=300"}
     )
 
 
@@ -1,10 +1,39 @@
 """Environment configuration and validation."""
 
+import json
+import logging
+import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Annotated, Literal, Optional
 
-from pydantic import Field, field_validator
-from pydantic_settings import BaseSettings, SettingsConfigDict
+from dotenv import dotenv_values
+from pydantic import BaseModel, Field, field_validator
+from pydantic_settings import BaseSettings, NoDecode, SettingsConfigDict
+
+from .languages import TARGET_LANGUAGE_CODES
+
+
+logger = logging.getLogger(__name__)
+
+# Language codes accepted as translation target (ISO 639-1, lowercase),
+# derived from languages.py so the two cannot drift apart
+TargetLanguage = Literal[TARGET_LANGUAGE_CODES]
+
+
+class TranslatorResource(BaseModel):
+    """An additional Azure Translator resource to spread requests across."""
+    
+    key: str = Field(..., description="Translator API key")
+    region: str = Field(..., description="Azure region")
+    endpoint: str = Field(
+        default="https://api.cognitive.microsofttranslator.com",
+        description="Translator endpoint"
+    )
+    category: Optional[str] = Field(
+        default=None,
+        description="Custom Translator category ID (defaults to AZURE_TRANSLATOR_CATEGORY)"
+    )
 
 
 class Settings(BaseSettings):
@@ -28,15 +57,39 @@ class Settings(BaseSettings):
         default="",
         description="Custom Translator category ID (optional)"
     )
+    azure_translator_max_concurrent: int = Field(
+        default=8,
+        ge=1,
+        description="Maximum concurrent requests to Azure Translator per process"
+    )
+    azure_translator_rps: float = Field(
+        default=0.0,
+        ge=0,
+        description="Maximum requests per second to Azure Translator per client (0 = unlimited)"
+    )
+    azure_translator_max_retries: int = Field(
+        default=3,
+        ge=0,
+        description="Retries for Azure Translator requests rejected with 429/503"
+    )
+    # Decoded by parse_extra_resources, so an empty value means no resources
+    azure_translator_extra_resources: Annotated[list[TranslatorResource], NoDecode] = Field(
+        default_factory=list,
+        description="JSON list of additional Translator resources to pool with the main one"
+    )
     
     # Translation Configuration
-    target_language: str = Field(default="nl", description="Target language code")
+    target_language: TargetLanguage = Field(default="nl", description="Target language code")
     
     # Glossary Configuration
     glossary_path: str = Field(
         default="data/glossary.tsv",
         description="Path to TSV glossary file"
     )
+    glossary_cache_enabled: bool = Field(
+        default=False,
+        description="Cache parsed glossary columns as <file>.cache.json next to each glossary"
+    )
     
     # Azure OpenAI Configuration (optional)
     enable_post_editor: bool = Field(
@@ -59,6 +112,15 @@ class Settings(BaseSettings):
         default="2024-02-15-preview",
         description="Azure OpenAI API version"
     )
+    azure_openai_batch_api_version: str = Field(
+        default="2024-10-21",
+        description="Azure OpenAI API version for the Batch API (files/batches endpoints)"
+    )
+    azure_openai_max_concurrent: int = Field(
+        default=8,
+        ge=1,
+        description="Maximum concurrent requests to Azure OpenAI per process"
+    )
     
     # Translator API Preview Configuration (optional)
     translator_api_preview_endpoint: Optional[str] = Field(
@@ -79,16 +141,20 @@ class Settings(BaseSettings):
     port: int = Field(default=8000, description="Server port")
     debug: bool = Field(default=False, description="Debug mode")
     
-    @field_validator("glossary_path")
+    @field_validator("target_language", mode="before")
     @classmethod
-    def validate_glossary_path(cls, v: str) -> str:
-        """Ensure glossary path(s) are valid."""
-        raw_paths = [p.strip() for p in v.split(",") if p.strip()]
-        for raw_path in raw_paths:
-            path = Path(raw_path)
-            if not path.exists():
-                # Don't fail during initialization; log warning instead
-                print(f"Warning: Glossary file not found at {raw_path}")
+    def normalize_target_language(cls, v):
+        """Accept target language codes in any case (e.g. NL, De)."""
+        if isinstance(v, str):
+            return v.strip().lower()
+        return v
+    
+    @field_validator("azure_translator_extra_resources", mode="before")
+    @classmethod
+    def parse_extra_resources(cls, v):
+        """Parse the extra resources from their JSON environment value."""
+        if isinstance(v, str):
+            return json.loads(v) if v.strip() else []
         return v
     
     @field_validator("enable_post_editor")
@@ -104,23 +170,49 @@ class Settings(BaseSettings):
         """Get glossary path as Path object (first path if multiple)."""
         paths = self.get_glossary_paths()
         return paths[0] if paths else Path(self.glossary_path)
-
+    
     def get_glossary_paths(self) -> list[Path]:
         """Get glossary paths as a list of Path objects."""
-        return [Path(p.strip()) for p in self.glossary_path.split(",") if p.strip()]
+        paths = [Path(p.strip()) for p in self.glossary_path.split(",") if p.strip()]
+        for path in paths:
+            if not path.exists():
+                # Don't fail here; the glossary loader decides how to handle it
+                logger.warning("Glossary file not found at %s", path)
+        return paths
 
 
-# Global settings instance
-_settings: Optional[Settings] = None
+def _read_environment() -> dict:
+    """Snapshot configuration values from the .env file and process environment.
+    
+    Environment variables take precedence over the .env file, matching
+    pydantic-settings. Keys are lowercased and limited to known fields.
+    
+    Returns:
+        Dictionary of raw setting values keyed by field name
+    """
+    fields = Settings.model_fields
+    config = Settings.model_config
+    values = {}
+    
+    env_file = config.get("env_file")
+    if env_file and Path(env_file).is_file():
+        file_values = dotenv_values(env_file, encoding=config.get("env_file_encoding"))
+        for key, value in file_values.items():
+            if value is not None and key.lower() in fields:
+                values[key.lower()] = value
+    
+    for key, value in os.environ.items():
+        if key.lower() in fields:
+            values[key.lower()] = value
+    
+    return values
 
 
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
     """Get or create settings instance.
     
     Returns:
         Settings instance loaded from environment
     """
-    global _settings
-    if _settings is None:
-        _settings = Settings()
-    return _settings
+    return Settings.model_validate(_read_environment())
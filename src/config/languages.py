@@ -12,6 +12,13 @@ SUPPORTED_LANGUAGES: Dict[str, str] = {
     "en": "English",
 }
 
+# Codes accepted as translation target: Dutch (the glossary target language)
+# plus every supported source language
+TARGET_LANGUAGE_CODES = ("nl", *SUPPORTED_LANGUAGES)
+
+# Membership set for is_supported (codes are stored lowercase)
+_SUPPORTED_CODES = frozenset(SUPPORTED_LANGUAGES)
+
 
 def is_supported(language_code: str) -> bool:
     """Check if a language code is supported.
@@ -22,7 +29,9 @@ def is_supported(language_code: str) -> bool:
     Returns:
         True if language is supported, False otherwise
     """
-    return language_code.lower() in SUPPORTED_LANGUAGES
+    if not language_code.islower():
+        language_code = language_code.lower()
+    return language_code in _SUPPORTED_CODES
 
 
 def get_language_name(language_code: str) -> str:
@@ -34,4 +43,6 @@ def get_language_name(language_code: str) -> str:
     Returns:
         Full language name or 'Unknown' if not supported
     """
-    return SUPPORTED_LANGUAGES.get(language_code.lower(), "Unknown")
+    if not language_code.islower():
+        language_code = language_code.lower()
+    return SUPPORTED_LANGUAGES.get(language_code, "Unknown")
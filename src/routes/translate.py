@@ -1,22 +1,26 @@
 """Translation API routes."""
 
+import logging
 from typing import Optional
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field
 
 from ..config.env import get_settings
 from ..config.languages import SUPPORTED_LANGUAGES, is_supported
-from ..services.translator import TranslatorClient
+from ..services.translator import TranslatorClient, TranslatorPool
 from ..services.post_editor import PostEditor
 from ..terminology.glossary_loader import GlossaryLoader
 from ..terminology.enforcer import TerminologyEnforcer
-from ..terminology.audit import EnforcementAudit
+from ..terminology.masking import mask_terms, unmask_terms
 
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter(prefix="/api", tags=["translation"])
 
 # Global instances (initialized on startup)
-translator_client: Optional[TranslatorClient] = None
+translator_client: Optional[TranslatorPool] = None
 post_editor: Optional[PostEditor] = None
 glossary_loader: Optional[GlossaryLoader] = None
 terminology_enforcer: Optional[TerminologyEnforcer] = None
@@ -52,7 +56,7 @@ class TranslateResponse(BaseModel):
 
 
 @router.post("/translate", response_model=TranslateResponse)
-async def translate(request: TranslateRequest) -> TranslateResponse:
+async def translate(request: TranslateRequest) -> ORJSONResponse:
     """Translate text with glossary enforcement.
     
     Pipeline:
@@ -84,36 +88,7 @@ async def translate(request: TranslateRequest) -> TranslateResponse:
         # - Enforcer acts as auditable proof layer
         
         # Step 1: Identify glossary terms in source text and mask them
-        import re
-        source_terms_found = []
-        masked_text = request.text
-        placeholder_map = {}
-        
-        # Find all glossary terms in source text (longest first to avoid partial matches)
-        applicable_terms = terminology_enforcer.get_applicable_terms(request.text)
-        sorted_terms = sorted(applicable_terms, key=lambda e: len(e.source), reverse=True)
-        
-        placeholder_idx = 0
-        for entry in sorted_terms:
-            # Find all occurrences with word boundaries
-            pattern = re.compile(r'\b' + re.escape(entry.source) + r'\b', re.IGNORECASE)
-            matches = list(pattern.finditer(masked_text))
-            
-            for match in reversed(matches):  # Process in reverse to maintain positions
-                placeholder = f"__GLOSS_{placeholder_idx}__"
-                placeholder_map[placeholder] = {
-                    'target_term': entry.target,
-                    'source_term': entry.source,
-                    'original_case': match.group(0)
-                }
-                
-                # Replace term with placeholder
-                start, end = match.span()
-                masked_text = masked_text[:start] + placeholder + masked_text[end:]
-                placeholder_idx += 1
-                
-                if entry not in source_terms_found:
-                    source_terms_found.append(entry)
+        masked_text, placeholder_map = mask_terms(request.text, terminology_enforcer)
         
         # Step 2: Translate the masked text
         translation_result = await translator_client.translate(
@@ -126,41 +101,11 @@ async def translate(request: TranslateRequest) -> TranslateResponse:
         raw_translation = translation_result['translated_text']
         
         # Step 3: Replace placeholders with glossary target terms (preserving case)
-        audit = EnforcementAudit(
-            original_text=raw_translation,
-            enforced_text=""
-        )
-        
         enforced_translation = raw_translation
-        for placeholder, info in placeholder_map.items():
-            if placeholder in enforced_translation:
-                # Determine case preservation
-                target_term = info['target_term']
-                original_case = info['original_case']
-                
-                # Preserve case pattern
-                if original_case.isupper():
-                    replacement = target_term.upper()
-                elif original_case[0].isupper() if original_case else False:
-                    replacement = target_term[0].upper() + target_term[1:] if len(target_term) > 1 else target_term.upper()
-                else:
-                    replacement = target_term.lower()
-                
-                # Find placeholder position for audit
-                placeholder_pos = enforced_translation.find(placeholder)
-                
-                # Replace placeholder with glossary term
-                enforced_translation = enforced_translation.replace(placeholder, replacement)
-                
-                # Record in audit
-                audit.add_application(
-                    source_term=info['source_term'],
-                    target_term=target_term,
-                    position=placeholder_pos,
-                    original_text=placeholder
-                )
-        
-        audit.enforced_text = enforced_translation
+        applied_terms = []
+        if placeholder_map:
+            enforced_translation, audit = unmask_terms(raw_translation, placeholder_map)
+            applied_terms = audit.get_summary()['replacements']
         
         # Step 3: Optional post-editing
         final_translation = enforced_translation
@@ -168,7 +113,7 @@ async def translate(request: TranslateRequest) -> TranslateResponse:
         
         if request.enable_post_editor and post_editor and post_editor.is_available():
             # Get list of protected terms (terms that were applied)
-            protected_terms = [app.target_term for app in audit.applied_terms]
+            protected_terms = [term['target_term'] for term in applied_terms]
             
             # Post-edit
             final_translation = await post_editor.post_edit(
@@ -178,7 +123,7 @@ async def translate(request: TranslateRequest) -> TranslateResponse:
             post_edited = True
             
             # Validate that terms were preserved
-            preserved, changed = await post_editor.validate_term_preservation(
+            preserved, changed = post_editor.validate_term_preservation(
                 enforced_translation,
                 final_translation,
                 protected_terms
@@ -186,22 +131,23 @@ async def translate(request: TranslateRequest) -> TranslateResponse:
             
             if not preserved:
                 # Log warning but don't fail - use enforced version instead
-                print(f"Warning: Post-editor changed protected terms: {changed}")
+                logger.warning("Post-editor changed protected terms: %s", changed)
                 final_translation = enforced_translation
                 post_edited = False
         
-        # Build response
-        return TranslateResponse(
-            raw_translation=raw_translation,
-            enforced_translation=enforced_translation,
-            final_translation=final_translation,
-            post_edited=post_edited,
-            applied_terms=audit.get_summary()['replacements'],
-            source_language=request.source_language,
-            target_language=translation_result['target_language'],
-            detected_language=translation_result.get('detected_language'),
-            category_used=translation_result.get('category_used')
-        )
+        # Build response (returned directly, so FastAPI skips re-validating
+        # it against TranslateResponse before serializing)
+        return ORJSONResponse({
+            'raw_translation': raw_translation,
+            'enforced_translation': enforced_translation,
+            'final_translation': final_translation,
+            'post_edited': post_edited,
+            'applied_terms': applied_terms,
+            'source_language': request.source_language,
+            'target_language': translation_result['target_language'],
+            'detected_language': translation_result.get('detected_language'),
+            'category_used': translation_result.get('category_used')
+        })
         
     except Exception as e:
         raise HTTPException(
@@ -251,29 +197,37 @@ def initialize_services():
     
     settings = get_settings()
     
-    # Initialize translator
-    translator_client = TranslatorClient()
+    # Initialize translator; extra resources share the load with the main one
+    translator_client = TranslatorPool([TranslatorClient()] + [
+        TranslatorClient(
+            endpoint=resource.endpoint,
+            key=resource.key,
+            region=resource.region,
+            category=resource.category
+        )
+        for resource in settings.azure_translator_extra_resources
+    ])
     
     # Initialize post-editor if enabled
     if settings.enable_post_editor:
         try:
             post_editor = PostEditor()
         except Exception as e:
-            print(f"Warning: Could not initialize post-editor: {e}")
+            logger.warning("Could not initialize post-editor: %s", e)
             post_editor = None
     
     # Load glossary
     glossary_paths = settings.get_glossary_paths()
-    glossary_loader = GlossaryLoader(glossary_paths)
+    glossary_loader = GlossaryLoader(glossary_paths, use_cache=settings.glossary_cache_enabled)
     
     try:
         entries = glossary_loader.load()
-        terminology_enforcer = TerminologyEnforcer(entries)
-        print(f"Loaded {len(entries)} glossary terms from {glossary_paths}")
+        terminology_enforcer = TerminologyEnforcer.from_loader(glossary_loader)
+        logger.info("Loaded %d glossary terms from %s", len(entries), glossary_paths)
     except FileNotFoundError:
-        print(f"Warning: Glossary file not found at {glossary_paths}")
+        logger.warning("Glossary file not found at %s", glossary_paths)
         # Initialize with empty glossary
         terminology_enforcer = TerminologyEnforcer([])
     except Exception as e:
-        print(f"Error loading glossary: {e}")
+        logger.error("Error loading glossary: %s", e)
         terminology_enforcer = TerminologyEnforcer([])
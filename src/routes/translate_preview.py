@@ -2,6 +2,7 @@
 
 from typing import Optional, List
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field
 
 from ..config.env import get_settings
@@ -10,7 +11,7 @@ from ..services.translator_preview import get_preview_translator
 from ..services.post_editor import PostEditor
 from ..terminology.glossary_loader import GlossaryLoader
 from ..terminology.enforcer import TerminologyEnforcer
-from ..terminology.audit import EnforcementAudit
+from ..terminology.masking import mask_terms, unmask_terms
 
 
 router = APIRouter(prefix="/api/preview", tags=["preview-translation"])
@@ -122,34 +123,11 @@ async def translate_preview(request: PreviewTranslateRequest):
         # Step 1: Optional glossary enforcement
         applied_terms = []
         text_to_translate = request.text
+        placeholder_map = {}
         
         if request.enforce_glossary and glossary_loader:
             # Mask glossary terms before translation
-            import re
-            masked_text = request.text
-            placeholder_map = {}
-            placeholder_idx = 0
-            
-            applicable_terms = terminology_enforcer.get_applicable_terms(request.text)
-            sorted_terms = sorted(applicable_terms, key=lambda e: len(e.source), reverse=True)
-            
-            for entry in sorted_terms:
-                pattern = re.compile(r'\b' + re.escape(entry.source) + r'\b', re.IGNORECASE)
-                matches = list(pattern.finditer(masked_text))
-                
-                for match in reversed(matches):
-                    placeholder = f"__GLOSS_{placeholder_idx}__"
-                    placeholder_map[placeholder] = {
-                        'target_term': entry.target,
-                        'source_term': entry.source,
-                        'original_case': match.group(0)
-                    }
-                    
-                    start, end = match.span()
-                    masked_text = masked_text[:start] + placeholder + masked_text[end:]
-                    placeholder_idx += 1
-            
-            text_to_translate = masked_text
+            text_to_translate, placeholder_map = mask_terms(request.text, terminology_enforcer)
         
         # Step 2: Translate with preview API and optional LLM
         translation_result = await preview_translator.translate(
@@ -166,34 +144,9 @@ async def translate_preview(request: PreviewTranslateRequest):
         
         # Step 3: Replace placeholders with glossary terms
         enforced_translation = raw_translation
-        if request.enforce_glossary and 'placeholder_map' in locals():
-            audit = EnforcementAudit(
-                original_text=raw_translation,
-                enforced_text=""
-            )
-            
-            for placeholder, info in placeholder_map.items():
-                if placeholder in enforced_translation:
-                    target_term = info['target_term']
-                    original_case = info['original_case']
-                    
-                    # Preserve case
-                    if original_case.isupper():
-                        replacement = target_term.upper()
-                    elif original_case and original_case[0].isupper():
-                        replacement = target_term[0].upper() + target_term[1:] if len(target_term) > 1 else target_term.upper()
-                    else:
-                        replacement = target_term.lower()
-                    
-                    placeholder_pos = enforced_translation.find(placeholder)
-                    enforced_translation = enforced_translation.replace(placeholder, replacement)
-                    
-                    applied_terms.append({
-                        'source_term': info['source_term'],
-                        'target_term': target_term,
-                        'original_text': placeholder,
-                        'position': placeholder_pos
-                    })
+        if placeholder_map:
+            enforced_translation, audit = unmask_terms(raw_translation, placeholder_map)
+            applied_terms = audit.get_summary()['replacements']
         
         # Step 4: Optional post-editing
         final_translation = enforced_translation if enforced_translation else raw_translation
@@ -207,7 +160,7 @@ async def translate_preview(request: PreviewTranslateRequest):
                 protected_terms=protected_terms
             )
             
-            preserved, _ = await post_editor.validate_term_preservation(
+            preserved, _ = post_editor.validate_term_preservation(
                 final_translation if enforced_translation else raw_translation,
                 final_translation,
                 protected_terms
@@ -218,20 +171,22 @@ async def translate_preview(request: PreviewTranslateRequest):
             else:
                 final_translation = enforced_translation if enforced_translation else raw_translation
         
-        # Build response
-        return PreviewTranslateResponse(
-            raw_translation=raw_translation,
-            enforced_translation=enforced_translation if enforced_translation != raw_translation else None,
-            final_translation=final_translation,
-            post_edited=post_edited,
-            applied_terms=applied_terms,
-            source_language=request.source_language,
-            target_language=target_language,
-            llm_used=request.enable_llm,
-            deployment_name=request.deployment_name if request.enable_llm else None,
-            tone=request.tone,
-            available=True
-        )
+        # Build response (returned directly, so FastAPI skips re-validating
+        # it against PreviewTranslateResponse before serializing)
+        return ORJSONResponse({
+            'raw_translation': raw_translation,
+            'enforced_translation': enforced_translation if enforced_translation != raw_translation else None,
+            'final_translation': final_translation,
+            'post_edited': post_edited,
+            'applied_terms': applied_terms,
+            'source_language': request.source_language,
+            'target_language': target_language,
+            'method': "preview",
+            'llm_used': request.enable_llm,
+            'deployment_name': request.deployment_name if request.enable_llm else None,
+            'tone': request.tone,
+            'available': True
+        })
         
     except Exception as e:
         raise HTTPException(
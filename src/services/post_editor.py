@@ -1,8 +1,10 @@
 """Azure OpenAI post-editor for fluency improvements."""
 
-import json
-from typing import Optional, List
+import re
+import asyncio
+from typing import Optional, List, Dict
 import httpx
+import orjson
 from ..config.env import get_settings
 
 
@@ -29,8 +31,27 @@ CRITICAL: Terms in the DO_NOT_CHANGE list are domain-specific jargon and MUST re
 
 Return ONLY the improved Dutch text, nothing else."""
     
-    def __init__(self):
-        """Initialize post-editor with settings."""
+    BATCH_INSTRUCTIONS = """
+
+The text consists of numbered segments, each introduced by a marker line such as §§§0§§§. Edit every segment independently, keep every marker exactly as given on its own line, and return all segments in the same order."""
+    
+    # Maximum completion tokens per request
+    MAX_TOKENS = 2000
+    MAX_BATCH_TOKENS = 16000
+    
+    # Batch API job states after which no further progress is made
+    BATCH_TERMINAL_STATES = frozenset({'completed', 'failed', 'expired', 'cancelled'})
+    
+    # Splits a batched response into (index, segment) pairs
+    _SEGMENT_MARKER_RE = re.compile(r'§§§(\d+)§§§')
+    
+    def __init__(self, transport: Optional[httpx.AsyncBaseTransport] = None):
+        """Initialize post-editor with settings.
+        
+        Args:
+            transport: HTTP transport to send requests through (e.g. an
+                httpx.MockTransport in tests); defaults to the network
+        """
         self.settings = get_settings()
         
         if not self.settings.enable_post_editor:
@@ -43,6 +64,19 @@ Return ONLY the improved Dutch text, nothing else."""
         self.api_key = self.settings.azure_openai_key
         self.deployment = self.settings.azure_openai_deployment
         self.api_version = self.settings.azure_openai_api_version
+        self.batch_api_version = self.settings.azure_openai_batch_api_version
+        
+        # Cap in-flight requests to stay below the deployment's rate limits
+        self._semaphore = asyncio.Semaphore(self.settings.azure_openai_max_concurrent)
+        
+        # Shared client so connections (and TLS sessions) are reused across calls
+        self._client = httpx.AsyncClient(
+            http2=True,
+            timeout=60.0,
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+            headers={'api-key': self.api_key},
+            transport=transport
+        )
     
     async def post_edit(
         self,
@@ -61,54 +95,336 @@ Return ONLY the improved Dutch text, nothing else."""
         Raises:
             httpx.HTTPError: If API request fails
         """
-        # Build user prompt with protected terms as DO_NOT_CHANGE list
-        user_prompt = text
-        if protected_terms:
-            terms_list = ", ".join(f'"{term}"' for term in protected_terms)
-            user_prompt = (
-                f"DO_NOT_CHANGE list (preserve exactly): {terms_list}\n\n"
-                f"Text to improve:\n{text}"
-            )
+        user_prompt = self._build_user_prompt(text, protected_terms)
+        return await self._complete(self.SYSTEM_PROMPT, user_prompt, self.MAX_TOKENS)
+    
+    async def post_edit_many(
+        self,
+        texts: List[str],
+        protected_terms: Optional[List[str]] = None
+    ) -> List[str]:
+        """Post-edit several translated segments with concurrent requests.
         
+        Each segment gets its own request; the client semaphore caps how
+        many are in flight at once.
+        
+        Args:
+            texts: Translated segments to improve
+            protected_terms: List of terms that must not be changed
+            
+        Returns:
+            Post-edited segments, in input order
+            
+        Raises:
+            httpx.HTTPError: If any API request fails
+        """
+        return list(await asyncio.gather(
+            *(self.post_edit(text, protected_terms) for text in texts)
+        ))
+    
+    async def post_edit_batch(
+        self,
+        texts: List[str],
+        protected_terms: Optional[List[str]] = None
+    ) -> List[str]:
+        """Post-edit several translated segments in a single request.
+        
+        Segments are sent as one prompt with numbered markers and split
+        again on the same markers. If a segment already contains a marker,
+        or the response cannot be split into the expected segments, each
+        segment is post-edited separately.
+        
+        Args:
+            texts: Translated segments to improve
+            protected_terms: List of terms that must not be changed
+            
+        Returns:
+            Post-edited segments, in input order
+            
+        Raises:
+            httpx.HTTPError: If API request fails
+        """
+        if len(texts) <= 1:
+            return [await self.post_edit(text, protected_terms) for text in texts]
+        
+        # A segment that itself contains a marker would be split in the wrong
+        # place, so such input is post-edited segment by segment instead
+        if any(self._SEGMENT_MARKER_RE.search(text) for text in texts):
+            return await self.post_edit_many(texts, protected_terms)
+        
+        combined = "\n".join(f"§§§{i}§§§\n{text}" for i, text in enumerate(texts))
+        user_prompt = self._build_user_prompt(combined, protected_terms)
+        content = await self._complete(
+            self.SYSTEM_PROMPT + self.BATCH_INSTRUCTIONS,
+            user_prompt,
+            min(self.MAX_TOKENS * len(texts), self.MAX_BATCH_TOKENS)
+        )
+        
+        segments = self._split_segments(content, len(texts))
+        if segments is None:
+            return await self.post_edit_many(texts, protected_terms)
+        return segments
+    
+    def _split_segments(self, content: str, count: int) -> Optional[List[str]]:
+        """Split a batched response on its segment markers.
+        
+        Args:
+            content: Response text containing §§§N§§§ markers
+            count: Expected number of segments
+            
+        Returns:
+            Segments in index order, or None if markers are missing or unexpected
+        """
+        parts = self._SEGMENT_MARKER_RE.split(content)
+        segments = {}
+        for i in range(1, len(parts) - 1, 2):
+            segments[int(parts[i])] = parts[i + 1].strip()
+        
+        if sorted(segments) != list(range(count)):
+            return None
+        return [segments[i] for i in range(count)]
+    
+    def _build_user_prompt(
+        self,
+        text: str,
+        protected_terms: Optional[List[str]]
+    ) -> str:
+        """Build user prompt with protected terms as DO_NOT_CHANGE list.
+        
+        Args:
+            text: Text to improve
+            protected_terms: List of terms that must not be changed
+            
+        Returns:
+            User prompt
+        """
+        if not protected_terms:
+            return text
+        
+        terms_list = ", ".join(f'"{term}"' for term in protected_terms)
+        return (
+            f"DO_NOT_CHANGE list (preserve exactly): {terms_list}\n\n"
+            f"Text to improve:\n{text}"
+        )
+    
+    async def _complete(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        max_tokens: int
+    ) -> str:
+        """Run a chat completion and return the stripped response text.
+        
+        Args:
+            system_prompt: System message
+            user_prompt: User message
+            max_tokens: Maximum completion tokens
+            
+        Returns:
+            Response text
+            
+        Raises:
+            httpx.HTTPError: If API request fails
+            ValueError: If the response has no choices
+        """
         # Build API request
         url = (
             f"{self.endpoint}/openai/deployments/{self.deployment}"
             f"/chat/completions?api-version={self.api_version}"
         )
         
-        headers = {
-            'Content-Type': 'application/json',
-            'api-key': self.api_key
-        }
-        
         body = {
             'messages': [
-                {'role': 'system', 'content': self.SYSTEM_PROMPT},
+                {'role': 'system', 'content': system_prompt},
                 {'role': 'user', 'content': user_prompt}
             ],
             'temperature': 0.3,  # Low temperature for consistency
-            'max_tokens': 2000,
+            'max_tokens': max_tokens,
             'top_p': 0.95
         }
         
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
+        async with self._semaphore:
+            response = await self._client.post(
                 url,
-                headers=headers,
-                json=body,
-                timeout=60.0
+                content=orjson.dumps(body),
+                headers={'Content-Type': 'application/json'}
             )
-            response.raise_for_status()
+        response.raise_for_status()
+        
+        result = orjson.loads(response.content)
+        
+        # Extract the post-edited text
+        if 'choices' in result and len(result['choices']) > 0:
+            message = result['choices'][0].get('message', {})
+            content = message.get('content', '').strip()
+            return content
+        
+        raise ValueError("Unexpected response format from Azure OpenAI")
+    
+    async def submit_batch_job(
+        self,
+        texts: List[str],
+        protected_terms: Optional[List[str]] = None
+    ) -> str:
+        """Submit segments to the Azure OpenAI Batch API for post-editing.
+        
+        Intended for bulk/offline workloads: the Batch API is cheaper than
+        synchronous chat completions but results may take hours. Requires a
+        Global Batch deployment. No API route uses the Batch API; it is
+        meant to be called from scripts and background jobs.
+        
+        Args:
+            texts: Translated segments to improve
+            protected_terms: List of terms that must not be changed
             
-            result = response.json()
+        Returns:
+            Batch job ID
             
-            # Extract the post-edited text
-            if 'choices' in result and len(result['choices']) > 0:
-                message = result['choices'][0].get('message', {})
-                content = message.get('content', '').strip()
-                return content
+        Raises:
+            httpx.HTTPError: If a Batch API request fails
+        """
+        lines = []
+        for i, text in enumerate(texts):
+            lines.append(orjson.dumps({
+                'custom_id': str(i),
+                'method': 'POST',
+                'url': '/chat/completions',
+                'body': {
+                    'model': self.deployment,
+                    'messages': [
+                        {'role': 'system', 'content': self.SYSTEM_PROMPT},
+                        {'role': 'user', 'content': self._build_user_prompt(text, protected_terms)}
+                    ],
+                    'temperature': 0.3,
+                    'max_tokens': self.MAX_TOKENS,
+                    'top_p': 0.95
+                }
+            }))
+        
+        params = {'api-version': self.batch_api_version}
+        
+        # Upload the JSONL request file
+        async with self._semaphore:
+            response = await self._client.post(
+                f"{self.endpoint}/openai/files",
+                params=params,
+                data={'purpose': 'batch'},
+                files={'file': ('post_edit.jsonl', b"\n".join(lines), 'application/jsonl')}
+            )
+        response.raise_for_status()
+        input_file_id = orjson.loads(response.content)['id']
+        
+        # Create the batch job
+        body = {
+            'input_file_id': input_file_id,
+            'endpoint': '/chat/completions',
+            'completion_window': '24h'
+        }
+        async with self._semaphore:
+            response = await self._client.post(
+                f"{self.endpoint}/openai/batches",
+                params=params,
+                content=orjson.dumps(body),
+                headers={'Content-Type': 'application/json'}
+            )
+        response.raise_for_status()
+        return orjson.loads(response.content)['id']
+    
+    async def get_batch_job(self, batch_id: str) -> Dict:
+        """Get the status of a Batch API job.
+        
+        Args:
+            batch_id: Batch job ID
             
-            raise ValueError("Unexpected response format from Azure OpenAI")
+        Returns:
+            Batch job object as returned by the API
+        """
+        async with self._semaphore:
+            response = await self._client.get(
+                f"{self.endpoint}/openai/batches/{batch_id}",
+                params={'api-version': self.batch_api_version}
+            )
+        response.raise_for_status()
+        return orjson.loads(response.content)
+    
+    async def get_batch_results(self, batch: Dict, texts: List[str]) -> List[str]:
+        """Download the output of a completed Batch API job.
+        
+        Segments without a successful result keep their original text.
+        
+        Args:
+            batch: Completed batch job object
+            texts: Segments that were submitted, in submission order
+            
+        Returns:
+            Post-edited segments, in input order
+        """
+        results = list(texts)
+        
+        output_file_id = batch.get('output_file_id')
+        if not output_file_id:
+            return results
+        
+        async with self._semaphore:
+            response = await self._client.get(
+                f"{self.endpoint}/openai/files/{output_file_id}/content",
+                params={'api-version': self.batch_api_version}
+            )
+        response.raise_for_status()
+        
+        for line in response.content.splitlines():
+            if not line.strip():
+                continue
+            record = orjson.loads(line)
+            result = record.get('response') or {}
+            if result.get('status_code') != 200:
+                continue
+            
+            choices = result.get('body', {}).get('choices', [])
+            if choices:
+                index = int(record['custom_id'])
+                results[index] = choices[0].get('message', {}).get('content', '').strip()
+        
+        return results
+    
+    async def post_edit_jsonl(
+        self,
+        texts: List[str],
+        protected_terms: Optional[List[str]] = None,
+        poll_interval: float = 30.0
+    ) -> List[str]:
+        """Post-edit segments through the Batch API and wait for the result.
+        
+        Args:
+            texts: Translated segments to improve
+            protected_terms: List of terms that must not be changed
+            poll_interval: Seconds between job status checks
+            
+        Returns:
+            Post-edited segments, in input order
+            
+        Raises:
+            httpx.HTTPError: If a Batch API request fails
+            RuntimeError: If the batch job does not complete
+        """
+        if not texts:
+            return []
+        
+        batch_id = await self.submit_batch_job(texts, protected_terms)
+        
+        batch = await self.get_batch_job(batch_id)
+        while batch.get('status') not in self.BATCH_TERMINAL_STATES:
+            await asyncio.sleep(poll_interval)
+            batch = await self.get_batch_job(batch_id)
+        
+        if batch['status'] != 'completed':
+            raise RuntimeError(f"Batch job {batch_id} ended with status: {batch['status']}")
+        
+        return await self.get_batch_results(batch, texts)
+    
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client."""
+        await self._client.aclose()
     
     def is_available(self) -> bool:
         """Check if post-editor is available and configured.
@@ -122,7 +438,7 @@ Return ONLY the improved Dutch text, nothing else."""
             and bool(self.settings.azure_openai_key)
         )
     
-    async def validate_term_preservation(
+    def validate_term_preservation(
         self,
         original: str,
         edited: str,
@@ -140,12 +456,14 @@ Return ONLY the improved Dutch text, nothing else."""
         """
         changed_terms = []
         
+        # Lowercase both texts once rather than per term
+        original_lower = original.lower()
+        edited_lower = edited.lower()
+        
         for term in terms:
             # Check if term appears same number of times in both
-            original_count = original.lower().count(term.lower())
-            edited_count = edited.lower().count(term.lower())
-            
-            if original_count != edited_count:
+            term_lower = term.lower()
+            if original_lower.count(term_lower) != edited_lower.count(term_lower):
                 changed_terms.append(term)
         
         return (len(changed_terms) == 0, changed_terms)
@@ -0,0 +1,99 @@
+"""Client-side rate limiting and retries for Azure API calls."""
+
+import asyncio
+from typing import Awaitable, Callable
+
+import httpx
+
+
+# Status codes Azure returns when a request is throttled or briefly unavailable
+RETRY_STATUS_CODES = {429, 503}
+
+# Upper bound for a single wait between retries, in seconds
+MAX_RETRY_DELAY = 60.0
+
+
+class RateLimiter:
+    """Spaces request starts so that at most ``rate`` begin per second.
+    
+    Each caller reserves the next free time slot and sleeps until it; a
+    rate of 0 disables limiting.
+    """
+    
+    def __init__(
+        self,
+        rate: float = 0.0,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep
+    ):
+        """Initialize rate limiter.
+        
+        Args:
+            rate: Maximum requests per second (0 = unlimited)
+            sleep: Coroutine function used to wait for a slot
+        """
+        self._interval = 1.0 / rate if rate > 0 else 0.0
+        self._next_slot = 0.0
+        self._sleep = sleep
+    
+    async def __aenter__(self) -> "RateLimiter":
+        if self._interval:
+            loop = asyncio.get_running_loop()
+            now = loop.time()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self._interval
+            if slot > now:
+                await self._sleep(slot - now)
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        return None
+
+
+def retry_delay(response: httpx.Response, attempt: int) -> float:
+    """Get the wait before retrying a throttled response.
+    
+    Args:
+        response: Response with a retryable status code
+        attempt: Zero-based attempt number that produced the response
+    
+    Returns:
+        Seconds from the Retry-After header, or exponential backoff
+    """
+    retry_after = response.headers.get('Retry-After')
+    if retry_after is not None:
+        try:
+            return min(max(float(retry_after), 0.0), MAX_RETRY_DELAY)
+        except ValueError:
+            # HTTP-date form; fall back to backoff
+            pass
+    return min(2.0 ** attempt, MAX_RETRY_DELAY)
+
+
+async def send_with_retry(
+    send: Callable[[], Awaitable[httpx.Response]],
+    limiter: RateLimiter,
+    max_retries: int,
+    sleep: Callable[[float], Awaitable[None]] = asyncio.sleep
+) -> httpx.Response:
+    """Send a request, retrying while Azure answers 429 or 503.
+    
+    Args:
+        send: Callable that issues the request
+        limiter: Rate limiter every attempt passes through
+        max_retries: Maximum number of retries
+        sleep: Coroutine function used to wait between attempts
+    
+    Returns:
+        The first non-retryable response, or the last response once
+        retries are exhausted
+    """
+    attempt = 0
+    while True:
+        async with limiter:
+            response = await send()
+        
+        if response.status_code not in RETRY_STATUS_CODES or attempt >= max_retries:
+            return response
+        
+        await sleep(retry_delay(response, attempt))
+        attempt += 1
@@ -1,22 +1,111 @@
 """Azure Translator Text v3 API client."""
 
+import asyncio
+from contextlib import contextmanager
 import httpx
-from typing import Optional, List, Dict
+import orjson
+from typing import Iterator, Optional, List, Dict
 from ..config.env import get_settings
+from .rate_limit import RateLimiter, send_with_retry
+
+
+# Translator v3 limits per translate request
+MAX_BATCH_ITEMS = 100
+MAX_BATCH_CHARS = 50000
+
+
+def _chunk_texts(texts: List[str], max_items: int, max_chars: int) -> Iterator[List[str]]:
+    """Group texts into consecutive chunks that respect request limits.
+    
+    A single text longer than max_chars gets a chunk of its own.
+    
+    Args:
+        texts: Texts to group
+        max_items: Maximum number of texts per chunk
+        max_chars: Maximum total characters per chunk
+    
+    Yields:
+        Lists of texts, in input order
+    """
+    chunk = []
+    chunk_chars = 0
+    for text in texts:
+        if chunk and (len(chunk) >= max_items or chunk_chars + len(text) > max_chars):
+            yield chunk
+            chunk = []
+            chunk_chars = 0
+        chunk.append(text)
+        chunk_chars += len(text)
+    if chunk:
+        yield chunk
 
 
 class TranslatorClient:
     """Client for Azure Translator Text v3 API."""
     
-    def __init__(self):
-        """Initialize translator client with settings."""
+    def __init__(
+        self,
+        endpoint: Optional[str] = None,
+        key: Optional[str] = None,
+        region: Optional[str] = None,
+        category: Optional[str] = None,
+        max_concurrent: Optional[int] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None
+    ):
+        """Initialize translator client with settings.
+        
+        Every resource argument defaults to the corresponding
+        AZURE_TRANSLATOR_* setting; pass them to target another Translator
+        resource.
+        
+        Args:
+            endpoint: Translator endpoint
+            key: Translator API key
+            region: Azure region of the resource
+            category: Custom Translator category ID
+            max_concurrent: Maximum concurrent requests to this resource
+            transport: HTTP transport to send requests through (e.g. an
+                httpx.MockTransport in tests); defaults to the network
+        """
         self.settings = get_settings()
-        self.base_url = self.settings.azure_translator_endpoint.rstrip('/')
+        self.base_url = (endpoint or self.settings.azure_translator_endpoint).rstrip('/')
         self.headers = {
-            'Ocp-Apim-Subscription-Key': self.settings.azure_translator_key,
-            'Ocp-Apim-Subscription-Region': self.settings.azure_translator_region,
+            'Ocp-Apim-Subscription-Key': key or self.settings.azure_translator_key,
+            'Ocp-Apim-Subscription-Region': region or self.settings.azure_translator_region,
             'Content-Type': 'application/json'
         }
+        self.category = self.settings.azure_translator_category if category is None else category
+        self.capacity = max_concurrent or self.settings.azure_translator_max_concurrent
+        
+        # Group key used to attribute load when several resources are pooled
+        self.group = httpx.URL(self.base_url).host
+        
+        # Endpoints and constant query parameters, built once per client
+        self._translate_url = f"{self.base_url}/translate"
+        self._detect_url = f"{self.base_url}/detect"
+        self._languages_url = f"{self.base_url}/languages"
+        self._base_params = {'api-version': '3.0'}
+        if self.category:
+            self._category_params = {**self._base_params, 'category': self.category}
+            self._strict_category_params = {**self._category_params, 'allowFallback': 'false'}
+        else:
+            self._category_params = self._strict_category_params = self._base_params
+        
+        # Cap in-flight requests to stay below the resource's rate limits
+        self._semaphore = asyncio.Semaphore(self.capacity)
+        
+        # Pace request starts and retry throttled (429/503) responses
+        self._limiter = RateLimiter(self.settings.azure_translator_rps)
+        self.max_retries = self.settings.azure_translator_max_retries
+        
+        # Shared client so connections (and TLS sessions) are reused across calls
+        self._client = httpx.AsyncClient(
+            http2=True,
+            timeout=30.0,
+            limits=httpx.Limits(max_connections=128, max_keepalive_connections=64),
+            headers=self.headers,
+            transport=transport
+        )
     
     async def translate(
         self,
@@ -34,101 +123,226 @@ class TranslatorClient:
             target_language: Target language code (defaults to settings)
             use_custom_category: Whether to use custom translator category
             allow_fallback: Whether to allow fallback to default translation
-            
+        
         Returns:
             Dictionary with translation result
-            
+        
         Raises:
             httpx.HTTPError: If translation request fails
         """
         if target_language is None:
             target_language = self.settings.target_language
         
-        # Build API endpoint
-        endpoint = f"{self.base_url}/translate"
-        
         # Build query parameters
-        params = {
-            'api-version': '3.0',
-            'from': source_language,
-            'to': target_language,
-        }
-        
-        # Add custom category if configured and requested
-        if use_custom_category and self.settings.azure_translator_category:
-            params['category'] = self.settings.azure_translator_category
-            if not allow_fallback:
-                params['allowFallback'] = 'false'
+        params = self._build_translate_params(
+            source_language, target_language, use_custom_category, allow_fallback
+        )
         
         # Build request body
         body = [{'text': text}]
         
         # Make request
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                endpoint,
-                params=params,
-                headers=self.headers,
-                json=body,
-                timeout=30.0
+        response = await self._request('POST', self._translate_url, params=params, content=orjson.dumps(body))
+        
+        result = orjson.loads(response.content)
+        
+        # Extract translation from response
+        if result and len(result) > 0:
+            translation = self._parse_translation(
+                result[0], source_language, target_language, use_custom_category
             )
-            response.raise_for_status()
+            if translation is not None:
+                return translation
+        
+        raise ValueError("Unexpected response format from Azure Translator")
+    
+    async def translate_batch(
+        self,
+        texts: List[str],
+        source_language: str,
+        target_language: Optional[str] = None,
+        use_custom_category: bool = True,
+        allow_fallback: bool = False,
+        max_items: int = MAX_BATCH_ITEMS,
+        max_chars: int = MAX_BATCH_CHARS
+    ) -> List[Dict]:
+        """Translate several texts with as few requests as possible.
+        
+        Texts are grouped into requests of at most ``max_items`` texts and
+        ``max_chars`` characters (the Translator v3 per-request limits).
+        
+        Args:
+            texts: Texts to translate
+            source_language: Source language code (e.g., 'de', 'fr')
+            target_language: Target language code (defaults to settings)
+            use_custom_category: Whether to use custom translator category
+            allow_fallback: Whether to allow fallback to default translation
+            max_items: Maximum number of texts per request
+            max_chars: Maximum total characters per request
+        
+        Returns:
+            Translation result dictionaries, in input order
+        
+        Raises:
+            httpx.HTTPError: If a translation request fails
+        """
+        if target_language is None:
+            target_language = self.settings.target_language
+        
+        params = self._build_translate_params(
+            source_language, target_language, use_custom_category, allow_fallback
+        )
+        
+        translations = []
+        for chunk in _chunk_texts(texts, max_items, max_chars):
+            body = [{'text': text} for text in chunk]
             
-            result = response.json()
+            response = await self._request('POST', self._translate_url, params=params, content=orjson.dumps(body))
             
-            # Extract translation from response
-            if result and len(result) > 0:
-                translation_result = result[0]
-                if 'translations' in translation_result and translation_result['translations']:
-                    translated_text = translation_result['translations'][0]['text']
-                    detected_language = translation_result.get('detectedLanguage', {})
-                    
-                    return {
-                        'translated_text': translated_text,
-                        'source_language': source_language,
-                        'target_language': target_language,
-                        'detected_language': detected_language.get('language'),
-                        'detection_score': detected_language.get('score'),
-                        'category_used': self.settings.azure_translator_category if use_custom_category else None
-                    }
+            result = orjson.loads(response.content)
+            if not isinstance(result, list) or len(result) != len(chunk):
+                raise ValueError("Unexpected response format from Azure Translator")
             
-            raise ValueError("Unexpected response format from Azure Translator")
+            for item in result:
+                translation = self._parse_translation(
+                    item, source_language, target_language, use_custom_category
+                )
+                if translation is None:
+                    raise ValueError("Unexpected response format from Azure Translator")
+                translations.append(translation)
+        
+        return translations
+    
+    async def translate_many(
+        self,
+        texts: List[str],
+        source_language: str,
+        target_language: Optional[str] = None,
+        use_custom_category: bool = True,
+        allow_fallback: bool = False,
+        batch_size: int = 50
+    ) -> List[Dict]:
+        """Translate many texts with concurrent batched requests.
+        
+        Texts are split into batches of ``batch_size`` that are sent
+        concurrently; the client semaphore (AZURE_TRANSLATOR_MAX_CONCURRENT)
+        bounds how many requests are in flight at once.
+        
+        Args:
+            texts: Texts to translate
+            source_language: Source language code (e.g., 'de', 'fr')
+            target_language: Target language code (defaults to settings)
+            use_custom_category: Whether to use custom translator category
+            allow_fallback: Whether to allow fallback to default translation
+            batch_size: Number of texts per request
+            
+        Returns:
+            Translation result dictionaries, in input order
+            
+        Raises:
+            httpx.HTTPError: If a translation request fails
+        """
+        batches = [texts[i:i + batch_size] for i in range(0, len(texts), batch_size)]
+        results = await asyncio.gather(*(
+            self.translate_batch(
+                batch,
+                source_language,
+                target_language=target_language,
+                use_custom_category=use_custom_category,
+                allow_fallback=allow_fallback,
+                max_items=batch_size
+            )
+            for batch in batches
+        ))
+        return [translation for batch in results for translation in batch]
+    
+    def _build_translate_params(
+        self,
+        source_language: str,
+        target_language: str,
+        use_custom_category: bool,
+        allow_fallback: bool
+    ) -> Dict[str, str]:
+        """Build query parameters for the translate endpoint.
+        
+        Args:
+            source_language: Source language code
+            target_language: Target language code
+            use_custom_category: Whether to use custom translator category
+            allow_fallback: Whether to allow fallback to default translation
+        
+        Returns:
+            Query parameters
+        """
+        # Custom category parameters are prebuilt (and empty when no category
+        # is configured)
+        if not use_custom_category:
+            base = self._base_params
+        elif allow_fallback:
+            base = self._category_params
+        else:
+            base = self._strict_category_params
+        
+        return {**base, 'from': source_language, 'to': target_language}
+    
+    def _parse_translation(
+        self,
+        item: Dict,
+        source_language: str,
+        target_language: str,
+        use_custom_category: bool
+    ) -> Optional[Dict]:
+        """Convert one element of a translate response into a result dictionary.
+        
+        Args:
+            item: Response element for a single input text
+            source_language: Source language code
+            target_language: Target language code
+            use_custom_category: Whether the custom category was requested
+        
+        Returns:
+            Translation result, or None if the element has no translation
+        """
+        if 'translations' not in item or not item['translations']:
+            return None
+        
+        detected_language = item.get('detectedLanguage', {})
+        return {
+            'translated_text': item['translations'][0]['text'],
+            'source_language': source_language,
+            'target_language': target_language,
+            'detected_language': detected_language.get('language'),
+            'detection_score': detected_language.get('score'),
+            'category_used': self.category if use_custom_category else None
+        }
     
     async def detect_language(self, text: str) -> Dict:
         """Detect language of text.
         
         Args:
             text: Text to analyze
-            
+        
         Returns:
             Dictionary with detected language info
         """
-        endpoint = f"{self.base_url}/detect"
-        params = {'api-version': '3.0'}
         body = [{'text': text}]
         
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                endpoint,
-                params=params,
-                headers=self.headers,
-                json=body,
-                timeout=30.0
-            )
-            response.raise_for_status()
-            
-            result = response.json()
-            
-            if result and len(result) > 0:
-                detection = result[0]
-                return {
-                    'language': detection.get('language'),
-                    'score': detection.get('score'),
-                    'is_translation_supported': detection.get('isTranslationSupported'),
-                    'alternatives': detection.get('alternatives', [])
-                }
-            
-            raise ValueError("Unexpected response format from language detection")
+        response = await self._request(
+            'POST', self._detect_url, params=self._base_params, content=orjson.dumps(body)
+        )
+        
+        result = orjson.loads(response.content)
+        
+        if result and len(result) > 0:
+            detection = result[0]
+            return {
+                'language': detection.get('language'),
+                'score': detection.get('score'),
+                'is_translation_supported': detection.get('isTranslationSupported'),
+                'alternatives': detection.get('alternatives', [])
+            }
+        
+        raise ValueError("Unexpected response format from language detection")
     
     async def get_supported_languages(self) -> Dict:
         """Get list of supported languages.
@@ -136,15 +350,135 @@ class TranslatorClient:
         Returns:
             Dictionary with supported languages
         """
-        endpoint = f"{self.base_url}/languages"
-        params = {'api-version': '3.0'}
-        
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                endpoint,
-                params=params,
-                timeout=30.0
+        response = await self._request('GET', self._languages_url, params=self._base_params)
+        
+        return orjson.loads(response.content)
+    
+    async def _request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        """Send a request with concurrency cap, rate limiting and retries.
+        
+        Args:
+            method: HTTP method
+            url: Request URL
+            **kwargs: Passed through to httpx.AsyncClient.request
+            
+        Returns:
+            Successful response
+            
+        Raises:
+            httpx.HTTPStatusError: If the final response is an error
+        """
+        async with self._semaphore:
+            response = await send_with_retry(
+                lambda: self._client.request(method, url, **kwargs),
+                self._limiter,
+                self.max_retries
             )
-            response.raise_for_status()
+        response.raise_for_status()
+        return response
+    
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client and its pooled connections."""
+        await self._client.aclose()
+
+
+class TranslatorPool:
+    """Spreads translation requests over several Translator resources.
+    
+    Each request goes to the client with the lowest share of its capacity
+    in use. A pool of one client behaves exactly like that client.
+    """
+    
+    def __init__(self, clients: List[TranslatorClient]):
+        """Initialize translator pool.
+        
+        Args:
+            clients: Translator clients, one per resource
+            
+        Raises:
+            ValueError: If no clients are given
+        """
+        if not clients:
+            raise ValueError("TranslatorPool needs at least one client")
+        
+        self.clients = list(clients)
+        self._in_flight = [0] * len(self.clients)
+    
+    @contextmanager
+    def _lease(self) -> Iterator[TranslatorClient]:
+        """Reserve the least loaded client for the duration of a call."""
+        index = min(
+            range(len(self.clients)),
+            key=lambda i: self._in_flight[i] / self.clients[i].capacity
+        )
+        self._in_flight[index] += 1
+        try:
+            yield self.clients[index]
+        finally:
+            self._in_flight[index] -= 1
+    
+    async def translate(self, *args, **kwargs) -> Dict:
+        """Translate text on the least loaded resource.
+        
+        Takes the same arguments as TranslatorClient.translate.
+        """
+        with self._lease() as client:
+            return await client.translate(*args, **kwargs)
+    
+    async def translate_batch(self, *args, **kwargs) -> List[Dict]:
+        """Translate a batch of texts on the least loaded resource.
+        
+        Takes the same arguments as TranslatorClient.translate_batch.
+        """
+        with self._lease() as client:
+            return await client.translate_batch(*args, **kwargs)
+    
+    async def translate_many(
+        self,
+        texts: List[str],
+        source_language: str,
+        batch_size: int = 50,
+        **kwargs
+    ) -> List[Dict]:
+        """Translate many texts, spreading batches across the pool.
+        
+        Args:
+            texts: Texts to translate
+            source_language: Source language code (e.g., 'de', 'fr')
+            batch_size: Number of texts per request
+            **kwargs: Passed through to TranslatorClient.translate_batch
             
-            return response.json()
+        Returns:
+            Translation result dictionaries, in input order
+        """
+        batches = [texts[i:i + batch_size] for i in range(0, len(texts), batch_size)]
+        results = await asyncio.gather(*(
+            self.translate_batch(batch, source_language, max_items=batch_size, **kwargs)
+            for batch in batches
+        ))
+        return [translation for batch in results for translation in batch]
+    
+    def get_load(self) -> Dict[str, int]:
+        """Get in-flight request counts per resource group (endpoint host).
+        
+        Returns:
+            Dictionary of group -> requests in flight
+        """
+        load: Dict[str, int] = {}
+        for client, in_flight in zip(self.clients, self._in_flight):
+            load[client.group] = load.get(client.group, 0) + in_flight
+        return load
+    
+    async def aclose(self) -> None:
+        """Close every client in the pool.
+        
+        All clients are closed even if one fails; the first error is then
+        raised.
+        """
+        results = await asyncio.gather(
+            *(client.aclose() for client in self.clients),
+            return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
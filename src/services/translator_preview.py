@@ -1,25 +1,45 @@
 """Azure Translator API Preview client with LLM support."""
 
+import logging
 import httpx
+import orjson
 from typing import Optional, Dict, Any
 from ..config.env import get_settings
+from .rate_limit import RateLimiter, send_with_retry
+
+
+logger = logging.getLogger(__name__)
 
 
 class TranslatorPreviewClient:
     """Client for Translator API preview with GPT-4o-mini deployment support."""
     
-    def __init__(self, key: str, endpoint: str, location: str):
+    def __init__(
+        self,
+        key: str,
+        endpoint: str,
+        location: str,
+        requests_per_second: float = 0.0,
+        max_retries: int = 3
+    ):
         """Initialize preview translator client.
         
         Args:
             key: API key for preview translator
             endpoint: Endpoint URL
             location: Azure region location
+            requests_per_second: Maximum request rate (0 = unlimited)
+            max_retries: Retries for throttled (429/503) responses
         """
         self.key = key
         self.endpoint = endpoint
         self.location = location
-        self.client = httpx.AsyncClient()
+        self.max_retries = max_retries
+        self._limiter = RateLimiter(requests_per_second)
+        self.client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_connections=128, max_keepalive_connections=64)
+        )
     
     async def translate(
         self,
@@ -72,15 +92,19 @@ class TranslatorPreviewClient:
                 ]
             }
             
-            response = await self.client.post(
-                url,
-                json=payload,
-                headers=headers,
-                timeout=30.0
+            response = await send_with_retry(
+                lambda: self.client.post(
+                    url,
+                    content=orjson.dumps(payload),
+                    headers=headers,
+                    timeout=30.0
+                ),
+                self._limiter,
+                self.max_retries
             )
             
             if response.status_code == 200:
-                result = response.json()
+                result = orjson.loads(response.content)
                 translated_text = self._extract_translation(result)
                 return {
                     'translated_text': translated_text,
@@ -96,7 +120,7 @@ class TranslatorPreviewClient:
                 
         except Exception as e:
             if allow_fallback:
-                print(f"Preview translator failed, falling back: {str(e)}")
+                logger.warning("Preview translator failed, falling back: %s", e)
                 return {
                     'translated_text': text,
                     'error': str(e),
@@ -189,7 +213,9 @@ def get_preview_translator() -> Optional[TranslatorPreviewClient]:
         return TranslatorPreviewClient(
             key=settings.translator_api_preview_key,
             endpoint=settings.translator_api_preview_endpoint,
-            location=settings.translator_api_preview_location
+            location=settings.translator_api_preview_location,
+            requests_per_second=settings.azure_translator_rps,
+            max_retries=settings.azure_translator_max_retries
         )
     
     return None
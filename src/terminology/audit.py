@@ -1,11 +1,14 @@
 """Audit and metrics tracking for terminology enforcement."""
 
-from typing import List, Dict
+import time
+from collections import Counter, deque
+from itertools import islice
+from typing import Deque, List, Dict, Optional
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timezone
 
 
-@dataclass
+@dataclass(slots=True)
 class TermApplication:
     """Represents a single application of a glossary term."""
     
@@ -13,17 +16,19 @@ class TermApplication:
     target_term: str
     position: int
     original_text: str  # The actual text that was replaced (may have different case)
-    timestamp: datetime = field(default_factory=datetime.utcnow)
+    timestamp_ns: int = field(default_factory=time.time_ns)  # Unix epoch, nanoseconds
 
 
-@dataclass
+@dataclass(slots=True)
 class EnforcementAudit:
     """Audit record for a single enforcement operation."""
     
     original_text: str
     enforced_text: str
     applied_terms: List[TermApplication] = field(default_factory=list)
-    timestamp: datetime = field(default_factory=datetime.utcnow)
+    timestamp_ns: int = field(default_factory=time.time_ns)  # Unix epoch, nanoseconds
+    # Collector that keeps running statistics over this audit, if any
+    collector: Optional["AuditCollector"] = field(default=None, repr=False, compare=False)
     
     def add_application(
         self,
@@ -40,14 +45,16 @@ class EnforcementAudit:
             position: Position in text where replacement occurred
             original_text: The actual text that was replaced
         """
-        self.applied_terms.append(
-            TermApplication(
-                source_term=source_term,
-                target_term=target_term,
-                position=position,
-                original_text=original_text
-            )
+        application = TermApplication(
+            source_term=source_term,
+            target_term=target_term,
+            position=position,
+            original_text=original_text
         )
+        self.applied_terms.append(application)
+        
+        if self.collector is not None:
+            self.collector.record_application(application)
     
     def get_summary(self) -> Dict:
         """Get audit summary.
@@ -67,16 +74,32 @@ class EnforcementAudit:
                 }
                 for app in self.applied_terms
             ],
-            "timestamp": self.timestamp.isoformat()
+            "timestamp": datetime.fromtimestamp(
+                self.timestamp_ns / 1e9, tz=timezone.utc
+            ).isoformat()
         }
 
 
 class AuditCollector:
     """Collects and manages enforcement audits."""
     
-    def __init__(self):
-        """Initialize audit collector."""
-        self._audits: List[EnforcementAudit] = []
+    def __init__(self, max_audits: int = 1000):
+        """Initialize audit collector.
+        
+        Args:
+            max_audits: Number of most recent audits to keep
+            
+        Raises:
+            ValueError: If max_audits is less than 1
+        """
+        if max_audits < 1:
+            raise ValueError(f"max_audits must be at least 1, got {max_audits}")
+        
+        self._audits: Deque[EnforcementAudit] = deque(maxlen=max_audits)
+        
+        # Running totals over the retained audits, so statistics are O(1)
+        self._total_replacements = 0
+        self._term_counts: Counter = Counter()
     
     def create_audit(self, original_text: str, enforced_text: str) -> EnforcementAudit:
         """Create a new audit record.
@@ -88,23 +111,57 @@ class AuditCollector:
         Returns:
             New audit record
         """
+        if len(self._audits) == self._audits.maxlen:
+            self._forget(self._audits[0])
+        
         audit = EnforcementAudit(
             original_text=original_text,
-            enforced_text=enforced_text
+            enforced_text=enforced_text,
+            collector=self
         )
         self._audits.append(audit)
         return audit
     
+    def record_application(self, application: TermApplication) -> None:
+        """Count a term application made on one of this collector's audits.
+        
+        Args:
+            application: Recorded term application
+        """
+        self._total_replacements += 1
+        self._term_counts[application.source_term] += 1
+    
+    def _forget(self, audit: EnforcementAudit) -> None:
+        """Remove an audit that is about to be evicted from the running totals.
+        
+        Args:
+            audit: Oldest retained audit
+        """
+        audit.collector = None
+        self._total_replacements -= len(audit.applied_terms)
+        for application in audit.applied_terms:
+            count = self._term_counts[application.source_term] - 1
+            if count:
+                self._term_counts[application.source_term] = count
+            else:
+                del self._term_counts[application.source_term]
+    
     def get_recent_audits(self, limit: int = 10) -> List[EnforcementAudit]:
         """Get most recent audit records.
         
         Args:
-            limit: Maximum number of audits to return
+            limit: Maximum number of audits to return (0 returns every audit)
             
         Returns:
             List of recent audits
         """
-        return self._audits[-limit:]
+        if limit <= 0:
+            # Same result as the list slice audits[-limit:]
+            return list(self._audits)[-limit:]
+        
+        recent = list(islice(reversed(self._audits), limit))
+        recent.reverse()
+        return recent
     
     def get_statistics(self) -> Dict:
         """Get aggregate statistics.
@@ -112,13 +169,12 @@ class AuditCollector:
         Returns:
             Dictionary with statistics
         """
-        total_replacements = sum(len(a.applied_terms) for a in self._audits)
-        all_terms = [app.source_term for a in self._audits for app in a.applied_terms]
+        total_replacements = self._total_replacements
         
         return {
             "total_audits": len(self._audits),
             "total_replacements": total_replacements,
-            "unique_terms_used": len(set(all_terms)),
+            "unique_terms_used": len(self._term_counts),
             "avg_replacements_per_audit": (
                 total_replacements / len(self._audits) if self._audits else 0
             )
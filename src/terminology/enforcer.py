@@ -1,21 +1,193 @@
 """Deterministic terminology enforcer with regex-based replacements."""
 
 import re
-from typing import List, Tuple, Optional
-from .glossary_loader import GlossaryEntry
+from functools import lru_cache
+from typing import Dict, Iterator, List, Tuple, Optional
+
+import ahocorasick
+
+from .glossary_loader import GlossaryEntry, GlossaryLoader, build_automaton
 from .audit import EnforcementAudit
 
 
+# Matches a single word character (same definition as regex \w)
+_WORD_CHAR = re.compile(r'\w')
+
+
 class TerminologyEnforcer:
     """Enforces glossary terms in translated text with case and punctuation handling."""
     
-    def __init__(self, entries: List[GlossaryEntry]):
+    # Number of distinct texts whose find_terms / enforce results are kept
+    FIND_TERMS_CACHE_SIZE = 1024
+    ENFORCE_CACHE_SIZE = 1024
+    
+    # Longer texts bypass the caches, which would otherwise pin every large
+    # request body in memory; repeats are mostly short segments anyway
+    MAX_CACHED_TEXT_LENGTH = 4096
+    
+    def __init__(
+        self,
+        entries: List[GlossaryEntry],
+        automaton: Optional[ahocorasick.Automaton] = None
+    ):
         """Initialize enforcer with glossary entries.
         
         Args:
             entries: List of glossary entries (should be sorted by length desc)
+            automaton: Automaton prebuilt from the same entries by
+                build_automaton; built here if not given
         """
         self.entries = entries
+        self._automaton = automaton if automaton is not None else build_automaton(entries)
+        self._entry_indices = self._index_entries(entries)
+        self._case_variants = {
+            entry.target: self._build_case_variants(entry.target) for entry in entries
+        }
+        
+        # Per-instance cache of scan results; a new glossary means a new
+        # enforcer, so cached spans can never outlive the entries they refer to
+        self._find_terms_cached = lru_cache(maxsize=self.FIND_TERMS_CACHE_SIZE)(
+            self._scan_terms
+        )
+        self._enforce_cached = lru_cache(maxsize=self.ENFORCE_CACHE_SIZE)(
+            self._apply_terms
+        )
+    
+    @classmethod
+    def from_loader(cls, loader: GlossaryLoader) -> "TerminologyEnforcer":
+        """Create an enforcer from a loaded glossary.
+        
+        Args:
+            loader: Glossary loader whose load() has been called
+            
+        Returns:
+            Enforcer using the loader's entries and automaton
+        """
+        return cls(loader.get_entries(), automaton=loader.build_automaton())
+    
+    @staticmethod
+    def _index_entries(entries: List[GlossaryEntry]) -> Dict[str, List[int]]:
+        """Map each lowercased source term to the positions of its entries.
+        
+        Args:
+            entries: Glossary entries
+            
+        Returns:
+            Dictionary of lowercased source -> indices into entries
+        """
+        indices: Dict[str, List[int]] = {}
+        for idx, entry in enumerate(entries):
+            indices.setdefault(entry.source.lower(), []).append(idx)
+        return indices
+    
+    def find_terms(self, text: str) -> List[Tuple[int, int, GlossaryEntry]]:
+        """Find glossary term occurrences in text with a single scan.
+        
+        Matching is case-insensitive and respects word boundaries. When
+        occurrences overlap, the leftmost wins, and the longest among those
+        starting at the same position.
+        
+        Args:
+            text: Text to search in
+            
+        Returns:
+            Non-overlapping (start, end, entry) tuples ordered by position
+        """
+        if self._automaton is None or not text:
+            return []
+        
+        if len(text) > self.MAX_CACHED_TEXT_LENGTH:
+            return list(self._scan_terms(text))
+        
+        # Repeated payloads (retries, previews, autosave) hit the cache
+        return list(self._find_terms_cached(text))
+    
+    def _scan_terms(self, text: str) -> Tuple[Tuple[int, int, GlossaryEntry], ...]:
+        """Scan text for glossary terms (uncached implementation of find_terms).
+        
+        Args:
+            text: Text to search in
+            
+        Returns:
+            Non-overlapping (start, end, entry) tuples ordered by position
+        """
+        lowered = self._lower_same_length(text)
+        return tuple(self._select_longest(list(self._iter_candidates(text, lowered))))
+    
+    def _iter_candidates(
+        self,
+        text: str,
+        lowered: str
+    ) -> Iterator[Tuple[int, int, GlossaryEntry]]:
+        """Yield every word-bounded term occurrence, overlapping ones included.
+        
+        Args:
+            text: Text to search in
+            lowered: Same-length lowercase copy of text (see _lower_same_length)
+            
+        Yields:
+            (start, end, entry) tuples in order of end position
+        """
+        for end_idx, (length, entry) in self._automaton.iter(lowered):
+            start = end_idx - length + 1
+            end = end_idx + 1
+            if self._is_word_bounded(text, start, end):
+                yield start, end, entry
+    
+    def cache_clear(self) -> None:
+        """Drop cached find_terms and enforce results."""
+        self._find_terms_cached.cache_clear()
+        self._enforce_cached.cache_clear()
+    
+    @staticmethod
+    def _lower_same_length(text: str) -> str:
+        """Lowercase text without changing any character offsets.
+        
+        A few characters (e.g. "İ") lowercase to more than one code point;
+        those are kept as they are so automaton match offsets still index
+        into the original text.
+        
+        Args:
+            text: Text to lowercase
+            
+        Returns:
+            Lowercased text with the same length as text
+        """
+        lowered = text.lower()
+        if len(lowered) == len(text):
+            return lowered
+        return ''.join(ch if len(ch.lower()) != 1 else ch.lower() for ch in text)
+    
+    @staticmethod
+    def _is_word_bounded(text: str, start: int, end: int) -> bool:
+        """Check that a span is not preceded or followed by a word character."""
+        if start > 0 and _WORD_CHAR.match(text, start - 1):
+            return False
+        if end < len(text) and _WORD_CHAR.match(text, end):
+            return False
+        return True
+    
+    @staticmethod
+    def _select_longest(
+        candidates: List[Tuple[int, int, GlossaryEntry]]
+    ) -> List[Tuple[int, int, GlossaryEntry]]:
+        """Resolve overlapping candidates, leftmost first, then longest.
+        
+        Args:
+            candidates: (start, end, entry) tuples, possibly overlapping
+            
+        Returns:
+            Non-overlapping (start, end, entry) tuples ordered by position
+        """
+        selected = []
+        last_end = 0
+        
+        for candidate in sorted(candidates, key=lambda c: (c[0], c[0] - c[1])):
+            if candidate[0] >= last_end:
+                selected.append(candidate)
+                last_end = candidate[1]
+        
+        return selected
     
     def enforce(
         self,
@@ -25,10 +197,10 @@ class TerminologyEnforcer:
         """Enforce glossary terms in text.
         
         Strategy:
-        1. Process entries longest-first to avoid partial matches
+        1. Find all terms in one Aho-Corasick scan (see find_terms)
         2. Use word boundaries to avoid substring replacements
-        3. Preserve case when possible
-        4. Handle punctuation attached to terms
+        3. Resolve overlaps leftmost first, then longest
+        4. Preserve case when possible
         
         Args:
             text: Text to enforce terminology in
@@ -37,71 +209,74 @@ class TerminologyEnforcer:
         Returns:
             Text with enforced terminology
         """
-        enforced_text = text
+        if not text:
+            return text
         
-        # Track positions that have been replaced to avoid overlapping replacements
-        replaced_ranges: List[Tuple[int, int]] = []
-        
-        for entry in self.entries:
-            # Find all matches for this term
-            matches = list(self._find_matches(enforced_text, entry.source))
-            
-            # Process matches in reverse order to maintain positions
-            for match_obj, matched_text in reversed(matches):
-                start, end = match_obj.span()
-                
-                # Skip if this range overlaps with an already-replaced range
-                if self._overlaps_with_any(start, end, replaced_ranges):
-                    continue
-                
-                # Get case-preserved replacement
-                replacement = self._preserve_case(matched_text, entry.target)
-                
-                # Perform replacement
-                enforced_text = (
-                    enforced_text[:start] + replacement + enforced_text[end:]
-                )
-                
-                # Record this replacement
-                replaced_ranges.append((start, start + len(replacement)))
-                
-                # Add to audit if provided
-                if audit:
-                    audit.add_application(
-                        source_term=entry.source,
-                        target_term=entry.target,
-                        position=start,
-                        original_text=matched_text
-                    )
-        
-        return enforced_text
-    
-    def _find_matches(
+        # Audits must record every call, so only the audit-less path is cached,
+        # and only for texts small enough to keep
+        if audit is None and len(text) <= self.MAX_CACHED_TEXT_LENGTH:
+            return self._enforce_cached(text)
+        return self._apply_terms(text, audit)
+    
+    def _apply_terms(
         self,
         text: str,
-        term: str
-    ) -> List[Tuple[re.Match, str]]:
-        """Find all matches of a term in text with word boundaries.
+        audit: Optional[EnforcementAudit] = None
+    ) -> str:
+        """Replace glossary terms in text (uncached implementation of enforce).
         
         Args:
-            text: Text to search in
-            term: Term to search for
+            text: Text to enforce terminology in
+            audit: Optional audit record to track replacements
             
         Returns:
-            List of (match_object, matched_text) tuples
+            Text with enforced terminology
         """
-        # Escape special regex characters in the term
-        escaped_term = re.escape(term)
+        matches = self.find_terms(text)
+        if not matches:
+            return text
+        
+        parts = []
+        cursor = 0
+        
+        # Length difference between enforced and original text so far, used
+        # to report audit positions in the enforced text
+        offset = 0
         
-        # Create pattern with word boundaries
-        # \b doesn't work well with some characters, so we use a more robust approach
-        pattern = r'(?<!\w)' + escaped_term + r'(?!\w)'
+        for start, end, entry in matches:
+            matched_text = text[start:end]
+            
+            # Get case-preserved replacement
+            replacement = self._preserve_case(matched_text, entry.target)
+            
+            # Add to audit if provided
+            if audit:
+                audit.add_application(
+                    source_term=entry.source,
+                    target_term=entry.target,
+                    position=start + offset,
+                    original_text=matched_text
+                )
+            
+            parts.append(text[cursor:start])
+            parts.append(replacement)
+            offset += len(replacement) - (end - start)
+            cursor = end
         
-        matches = []
-        for match in re.finditer(pattern, text, re.IGNORECASE):
-            matches.append((match, match.group(0)))
+        parts.append(text[cursor:])
+        return ''.join(parts)
+    
+    @staticmethod
+    def _build_case_variants(target: str) -> Tuple[str, str, str]:
+        """Precompute the cased forms of a target term.
         
-        return matches
+        Args:
+            target: Glossary target term
+            
+        Returns:
+            Tuple of (UPPER, Title, lower) forms
+        """
+        return target.upper(), target[:1].upper() + target[1:].lower(), target.lower()
     
     def _preserve_case(self, original: str, replacement: str) -> str:
         """Preserve case pattern from original text when replacing.
@@ -111,45 +286,27 @@ class TerminologyEnforcer:
             replacement: Replacement text
             
         Returns:
-            Replacement text with preserved case pattern
+            Replacement text in UPPER case when the original is upper case,
+            with a capital first letter when the original starts with one,
+            in lower case when the original is lower case, and otherwise
+            (e.g. "iPhone", or no cased characters) as-is
         """
-        # If original is all uppercase, make replacement uppercase
-        if original.isupper():
-            return replacement.upper()
-        
-        # If original is title case (first letter upper), make replacement title case
-        if original and original[0].isupper() and not original[1:].isupper():
-            return replacement[0].upper() + replacement[1:].lower()
+        variants = self._case_variants.get(replacement)
+        if variants is None:
+            variants = self._case_variants[replacement] = self._build_case_variants(replacement)
+        upper, title, lower = variants
         
-        # If original is all lowercase, make replacement lowercase
+        if original.isupper():
+            return upper
+        # Title and sentence case ("Critical incident") both start upper
+        if original[:1].isupper() and not original.isupper():
+            return title
         if original.islower():
-            return replacement.lower()
+            return lower
         
         # Default: return replacement as-is
         return replacement
     
-    def _overlaps_with_any(
-        self,
-        start: int,
-        end: int,
-        ranges: List[Tuple[int, int]]
-    ) -> bool:
-        """Check if a range overlaps with any in a list.
-        
-        Args:
-            start: Start position
-            end: End position
-            ranges: List of (start, end) tuples
-            
-        Returns:
-            True if overlaps with any range, False otherwise
-        """
-        for r_start, r_end in ranges:
-            # Check for overlap: ranges overlap if one starts before the other ends
-            if start < r_end and end > r_start:
-                return True
-        return False
-    
     def get_applicable_terms(self, text: str) -> List[GlossaryEntry]:
         """Get list of glossary terms that appear in text.
         
@@ -159,11 +316,14 @@ class TerminologyEnforcer:
         Returns:
             List of applicable glossary entries
         """
-        applicable = []
+        if self._automaton is None or not text:
+            return []
+        
+        lowered = self._lower_same_length(text)
         
-        for entry in self.entries:
-            matches = self._find_matches(text, entry.source)
-            if matches:
-                applicable.append(entry)
+        # One scan collects every word-bounded term, including terms nested
+        # inside longer ones
+        found = {lowered[start:end] for start, end, _ in self._iter_candidates(text, lowered)}
         
-        return applicable
+        indices = sorted(idx for key in found for idx in self._entry_indices[key])
+        return [self.entries[idx] for idx in indices]
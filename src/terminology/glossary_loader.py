@@ -1,13 +1,58 @@
 """TSV glossary loader for terminology management."""
 
 import csv
+import logging
+import os
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Iterable
+from typing import List, Dict, Iterable, Optional, Tuple
+
+import ahocorasick
+import orjson
+
+
+logger = logging.getLogger(__name__)
+
+# Allow arbitrarily long cells; the parser then never rejects a long
+# definition with a field-limit error
+try:
+    csv.field_size_limit(sys.maxsize)
+except OverflowError:
+    # sys.maxsize does not fit a C long on some platforms (e.g. Windows)
+    csv.field_size_limit(2 ** 31 - 1)
+
+# Odd 64-bit constant used to mix the target hash into the pair hash
+PAIR_HASH_MULTIPLIER = 0x9E3779B97F4A7C15
+PAIR_HASH_MASK = (1 << 64) - 1
+
+# Read buffer for glossary files; large files otherwise need many small reads
+READ_BUFFER_SIZE = 1 << 20
+
+# Parsed columns can be cached next to each glossary file as <file>.cache.json
+# (plain JSON columns, so a tampered cache can at worst inject terms);
+# bump the version whenever the parsing rules or the cache layout change
+CACHE_SUFFIX = '.cache.json'
+CACHE_VERSION = 2
+
+# Upper bound on threads used to read several glossary files at once
+MAX_LOAD_WORKERS = 8
+
+# Terms passed to GlossaryEntry() directly are only interned up to this length
+INTERN_MAX_LENGTH = 64
+
+
+def _intern_short(term: str) -> str:
+    """Intern a term unless it is longer than INTERN_MAX_LENGTH."""
+    return sys.intern(term) if len(term) <= INTERN_MAX_LENGTH else term
 
 
 class GlossaryEntry:
     """Represents a single glossary term entry."""
     
+    __slots__ = ('source', 'target', 'source_length')
+    
     def __init__(self, source: str, target: str):
         """Initialize glossary entry.
         
@@ -15,26 +60,81 @@ class GlossaryEntry:
             source: Source term (any language)
             target: Target term (Dutch)
         """
-        self.source = source.strip()
-        self.target = target.strip()
+        self.source = _intern_short(source.strip())
+        self.target = _intern_short(target.strip())
         # Store length for sorting (longest first to avoid partial matches)
         self.source_length = len(self.source)
     
+    @classmethod
+    def _create(cls, source: str, target: str) -> "GlossaryEntry":
+        """Create an entry from terms that are already stripped.
+        
+        Used by the loader, which strips every cell while parsing.
+        
+        Args:
+            source: Stripped source term
+            target: Stripped target term
+            
+        Returns:
+            New glossary entry
+        """
+        entry = cls.__new__(cls)
+        entry.source = source
+        entry.target = target
+        entry.source_length = len(source)
+        return entry
+    
     def __repr__(self) -> str:
         return f"GlossaryEntry(source='{self.source}', target='{self.target}')"
 
 
+def build_automaton(entries: List[GlossaryEntry]) -> Optional[ahocorasick.Automaton]:
+    """Build an Aho-Corasick automaton over lowercased glossary sources.
+    
+    Each key maps to ``(len(key), entry)`` so a match end can be turned into
+    a span without another lookup. ``Automaton.iter`` reports every
+    occurrence, overlapping ones included; the enforcer resolves overlaps
+    itself, leftmost first, then longest.
+    
+    Args:
+        entries: Glossary entries (first entry wins for duplicate sources)
+        
+    Returns:
+        Compiled automaton, or None if there are no terms
+    """
+    automaton = ahocorasick.Automaton()
+    for entry in entries:
+        key = entry.source.lower()
+        if key and key not in automaton:
+            automaton.add_word(key, (len(key), entry))
+    
+    if len(automaton) == 0:
+        return None
+    
+    automaton.make_automaton()
+    return automaton
+
+
 class GlossaryLoader:
     """Loads and manages TSV glossary files."""
     
-    def __init__(self, glossary_paths: Iterable[Path]):
+    def __init__(self, glossary_paths: Iterable[Path], use_cache: bool = False):
         """Initialize glossary loader.
         
         Args:
             glossary_paths: Iterable of TSV file paths (source<tab>target format)
+            use_cache: Whether to reuse and write parsed-column sidecar caches
+                (off by default; the glossary directory must then be trusted
+                not to hold a tampered cache)
         """
         self.glossary_paths = list(glossary_paths)
+        self.use_cache = use_cache
         self._entries: List[GlossaryEntry] = []
+        self._automaton: Optional[ahocorasick.Automaton] = None
+        # Column views of the loaded glossary, in the same order as _entries
+        self._sources: List[str] = []
+        self._targets: List[str] = []
+        self._lengths: List[int] = []
     
     def load(self) -> List[GlossaryEntry]:
         """Load glossary from TSV file(s).
@@ -49,53 +149,239 @@ class GlossaryLoader:
         if not self.glossary_paths:
             raise FileNotFoundError("No glossary paths provided")
         
-        entries: List[GlossaryEntry] = []
-        seen_pairs = set()
+        # Files are read concurrently (reads and the csv parser spend much
+        # of their time outside the GIL) and merged in path order
+        if len(self.glossary_paths) > 1:
+            workers = min(MAX_LOAD_WORKERS, len(self.glossary_paths))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                file_columns = list(executor.map(self._read_columns, self.glossary_paths))
+        else:
+            file_columns = [self._read_columns(self.glossary_paths[0])]
         
-        for glossary_path in self.glossary_paths:
-            if not glossary_path.exists():
-                raise FileNotFoundError(f"Glossary file not found: {glossary_path}")
-            
-            with open(glossary_path, 'r', encoding='utf-8') as f:
-                reader = csv.reader(f, delimiter='\t')
-                
-                for line_num, row in enumerate(reader, start=1):
-                    # Skip empty lines
-                    if not row or all(not cell.strip() for cell in row):
-                        continue
-                    
-                    # Skip comment lines
-                    if row[0].strip().startswith('#'):
-                        continue
-                    
-                    # Validate format
-                    if len(row) < 2:
-                        raise ValueError(
-                            f"Invalid glossary format at line {line_num} in {glossary_path}: "
-                            f"Expected 2 columns (source<tab>target), got {len(row)}"
-                        )
-                    
-                    source = row[0].strip()
-                    target = row[1].strip()
-                    
-                    # Skip empty entries
-                    if not source or not target:
-                        continue
-                    
-                    pair_key = (source, target)
-                    if pair_key in seen_pairs:
-                        continue
-                    
-                    seen_pairs.add(pair_key)
-                    entries.append(GlossaryEntry(source, target))
+        # A single file can still repeat a pair, so it goes through the same
+        # column dedup as several files
+        sources, targets = self._merge_columns(file_columns)
         
-        # Sort by source length descending to handle overlapping terms
+        # Sort an index permutation over the length column rather than the
+        # entry objects; the sort is stable, so equal lengths keep file order.
+        # Longest first handles overlapping terms
         # (e.g., "critical incident" before "incident")
-        entries.sort(key=lambda e: e.source_length, reverse=True)
+        lengths = list(map(len, sources))
+        order = sorted(range(len(lengths)), key=lengths.__getitem__, reverse=True)
+        
+        self._sources = [sources[i] for i in order]
+        self._targets = [targets[i] for i in order]
+        self._lengths = [lengths[i] for i in order]
+        
+        # Build all entries once, already in final order
+        entries = [
+            GlossaryEntry._create(source, target)
+            for source, target in zip(self._sources, self._targets)
+        ]
         
         self._entries = entries
+        self._automaton = None
         return entries
     
+    @staticmethod
+    def _merge_columns(
+        file_columns: List[Tuple[List[str], List[str]]]
+    ) -> Tuple[List[str], List[str]]:
+        """Concatenate per-file columns, keeping the first of repeated pairs.
+        
+        Args:
+            file_columns: (sources, targets) for each file, in path order
+            
+        Returns:
+            Tuple of merged (sources, targets)
+        """
+        sources: List[str] = []
+        targets: List[str] = []
+        # Pair hash -> index of the first pair kept with that hash; the stored
+        # index confirms equality on a hit without allocating a tuple per row
+        seen_hashes: Dict[int, int] = {}
+        # Pairs whose hash collided with a different, earlier pair
+        collided_pairs = set()
+        
+        for file_sources, file_targets in file_columns:
+            for source, target in zip(file_sources, file_targets):
+                pair_hash = hash(source) ^ ((hash(target) * PAIR_HASH_MULTIPLIER) & PAIR_HASH_MASK)
+                index = seen_hashes.get(pair_hash)
+                if index is None:
+                    seen_hashes[pair_hash] = len(sources)
+                elif sources[index] == source and targets[index] == target:
+                    continue
+                else:
+                    pair_key = (source, target)
+                    if pair_key in collided_pairs:
+                        continue
+                    collided_pairs.add(pair_key)
+                
+                sources.append(source)
+                targets.append(target)
+        
+        return sources, targets
+    
+    def _read_columns(self, glossary_path: Path) -> Tuple[List[str], List[str]]:
+        """Read one TSV file into stripped source and target columns.
+        
+        With caching enabled, uses the file's sidecar cache when it matches
+        the file's current size and modification time, and refreshes the
+        cache after a parse.
+        
+        Args:
+            glossary_path: TSV file path
+            
+        Returns:
+            Tuple of (sources, targets), row-aligned, in file order
+        
+        Raises:
+            FileNotFoundError: If the file doesn't exist
+            ValueError: If a row has fewer than two columns
+        """
+        if not glossary_path.exists():
+            raise FileNotFoundError(f"Glossary file not found: {glossary_path}")
+        
+        if not self.use_cache:
+            return self._parse_columns(glossary_path)
+        
+        stat = glossary_path.stat()
+        file_key = (CACHE_VERSION, stat.st_size, stat.st_mtime_ns)
+        cache_path = glossary_path.with_name(glossary_path.name + CACHE_SUFFIX)
+        
+        columns = self._read_cache(cache_path, file_key)
+        if columns is None:
+            columns = self._parse_columns(glossary_path)
+            self._write_cache(cache_path, file_key, columns)
+        return columns
+    
+    @staticmethod
+    def _read_cache(
+        cache_path: Path,
+        file_key: Tuple[int, int, int]
+    ) -> Optional[Tuple[List[str], List[str]]]:
+        """Load cached columns if the cache was written for file_key.
+        
+        Args:
+            cache_path: Sidecar cache path
+            file_key: (cache version, file size, file mtime in ns)
+            
+        Returns:
+            Tuple of (sources, targets), or None if the cache is missing,
+            stale or unreadable
+        """
+        try:
+            cached = orjson.loads(cache_path.read_bytes())
+        except FileNotFoundError:
+            return None
+        except (OSError, orjson.JSONDecodeError) as e:
+            logger.debug("Ignoring unreadable glossary cache %s: %s", cache_path, e)
+            return None
+        
+        if not isinstance(cached, dict) or cached.get('key') != list(file_key):
+            return None
+        
+        try:
+            # sys.intern also rejects any cell that is not a string
+            sources = list(map(sys.intern, cached['sources']))
+            targets = list(map(sys.intern, cached['targets']))
+        except (KeyError, TypeError) as e:
+            logger.debug("Ignoring malformed glossary cache %s: %s", cache_path, e)
+            return None
+        
+        if len(sources) != len(targets):
+            logger.debug("Ignoring malformed glossary cache %s: column lengths differ", cache_path)
+            return None
+        return sources, targets
+    
+    @staticmethod
+    def _write_cache(
+        cache_path: Path,
+        file_key: Tuple[int, int, int],
+        columns: Tuple[List[str], List[str]]
+    ) -> None:
+        """Write parsed columns to the sidecar cache.
+        
+        The cache is written to a temporary file and renamed into place, so a
+        concurrent reader never sees a partial file. Failures (e.g. a
+        read-only glossary directory) only cost the next load a re-parse.
+        
+        Args:
+            cache_path: Sidecar cache path
+            file_key: (cache version, file size, file mtime in ns)
+            columns: Tuple of (sources, targets)
+        """
+        tmp_path = cache_path.with_name(
+            f"{cache_path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+        )
+        try:
+            sources, targets = columns
+            tmp_path.write_bytes(orjson.dumps({
+                'key': file_key,
+                'sources': sources,
+                'targets': targets
+            }))
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            logger.debug("Could not write glossary cache %s: %s", cache_path, e)
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+    
+    @staticmethod
+    def _parse_columns(glossary_path: Path) -> Tuple[List[str], List[str]]:
+        """Parse one TSV file into stripped source and target columns.
+        
+        Args:
+            glossary_path: TSV file path
+            
+        Returns:
+            Tuple of (sources, targets), row-aligned, in file order
+        
+        Raises:
+            ValueError: If a row has fewer than two columns
+        """
+        sources: List[str] = []
+        targets: List[str] = []
+        
+        with open(glossary_path, 'r', encoding='utf-8', buffering=READ_BUFFER_SIZE, newline='') as f:
+            # Read all rows in one C-level pass and close the file before
+            # filtering them
+            rows = list(csv.reader(f, dialect='excel-tab'))
+        
+        for line_num, row in enumerate(rows, start=1):
+            # Skip empty lines; a blank source cell leaves nothing to load
+            # whatever the other cells hold, so only that cell is checked
+            if not row:
+                continue
+            source = row[0].strip()
+            
+            # Skip blank sources and comment lines
+            if not source or source.startswith('#'):
+                continue
+            
+            # A row without a target column only costs anything on the
+            # error path
+            try:
+                target = row[1].strip()
+            except IndexError:
+                raise ValueError(
+                    f"Invalid glossary format at line {line_num} in {glossary_path}: "
+                    f"Expected 2 columns (source<tab>target), got {len(row)}"
+                ) from None
+            
+            # Skip empty entries
+            if not target:
+                continue
+            
+            # Glossaries repeat targets across many sources; interning
+            # shares one string object per distinct term
+            sources.append(sys.intern(source))
+            targets.append(sys.intern(target))
+        
+        return sources, targets
+    
     def get_entries(self) -> List[GlossaryEntry]:
         """Get loaded glossary entries.
         
@@ -104,14 +390,29 @@ class GlossaryLoader:
         """
         return self._entries
     
+    def build_automaton(self) -> Optional[ahocorasick.Automaton]:
+        """Get the Aho-Corasick automaton for the loaded entries.
+        
+        The automaton is built on first use after each load() and reused
+        afterwards.
+        
+        Returns:
+            Compiled automaton, or None if no terms are loaded
+        """
+        if self._automaton is None and self._entries:
+            self._automaton = build_automaton(self._entries)
+        return self._automaton
+    
     def get_statistics(self) -> Dict[str, int]:
         """Get glossary statistics.
         
         Returns:
             Dictionary with statistics (total_terms, etc.)
         """
+        # The length column is sorted longest first by load()
+        lengths = self._lengths
         return {
             "total_terms": len(self._entries),
-            "longest_term": max((e.source_length for e in self._entries), default=0),
-            "shortest_term": min((e.source_length for e in self._entries), default=0),
+            "longest_term": lengths[0] if lengths else 0,
+            "shortest_term": lengths[-1] if lengths else 0,
         }
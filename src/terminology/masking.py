@@ -0,0 +1,121 @@
+"""Placeholder masking of glossary terms around machine translation."""
+
+import re
+from typing import Dict, Tuple
+
+from .enforcer import TerminologyEnforcer
+from .audit import EnforcementAudit
+
+
+# Placeholders emitted by mask_terms, and the pattern that finds them again
+PLACEHOLDER_FORMAT = "__GLOSS_{}__"
+PLACEHOLDER_RE = re.compile(r'__GLOSS_(\d+)__')
+
+
+def apply_case(target: str, sample: str) -> str:
+    """Apply the case pattern of a source-text sample to a target term.
+    
+    Args:
+        target: Glossary target term
+        sample: Source text the term was matched on
+        
+    Returns:
+        Target term in UPPER case, with a capitalised first letter, or in
+        lower case, following the sample
+    """
+    if sample.isupper():
+        return target.upper()
+    if sample[:1].isupper():
+        return target[:1].upper() + target[1:]
+    return target.lower()
+
+
+def mask_terms(
+    text: str,
+    enforcer: TerminologyEnforcer
+) -> Tuple[str, Dict[str, Dict[str, str]]]:
+    """Replace glossary terms in source text with placeholders.
+    
+    Args:
+        text: Source text to mask
+        enforcer: Terminology enforcer used to locate glossary terms
+    
+    Returns:
+        Tuple of (masked_text, placeholder_map) where placeholder_map maps
+        each placeholder to its source term, target term and original casing
+    """
+    # The enforcer scans a lowercased copy once; the original spelling is
+    # sliced from text so it can be restored on unmasking
+    matches = enforcer.find_terms(text)
+    if not matches:
+        return text, {}
+    
+    placeholder_map = {}
+    parts = []
+    cursor = 0
+    
+    for placeholder_idx, (start, end, entry) in enumerate(matches):
+        placeholder = PLACEHOLDER_FORMAT.format(placeholder_idx)
+        placeholder_map[placeholder] = {
+            'target_term': entry.target,
+            'source_term': entry.source,
+            'original_case': text[start:end]
+        }
+        
+        # Copy the text before the term, then the placeholder in its place
+        parts.append(text[cursor:start])
+        parts.append(placeholder)
+        cursor = end
+    
+    parts.append(text[cursor:])
+    masked_text = ''.join(parts)
+    
+    return masked_text, placeholder_map
+
+
+def unmask_terms(
+    translated: str,
+    placeholder_map: Dict[str, Dict[str, str]]
+) -> Tuple[str, EnforcementAudit]:
+    """Replace placeholders in translated text with glossary target terms.
+    
+    Args:
+        translated: Translated text containing placeholders
+        placeholder_map: Mapping produced by mask_terms
+    
+    Returns:
+        Tuple of (enforced_text, audit) where audit records every
+        placeholder that was replaced
+    """
+    audit = EnforcementAudit(
+        original_text=translated,
+        enforced_text=""
+    )
+    
+    # Length difference between enforced and translated text so far, used to
+    # report audit positions in the enforced text
+    offset = 0
+    
+    def replace_placeholder(match: re.Match) -> str:
+        nonlocal offset
+        placeholder = match.group(0)
+        info = placeholder_map.get(placeholder)
+        if info is None:
+            return placeholder
+        
+        target_term = info['target_term']
+        replacement = apply_case(target_term, info['original_case'])
+        
+        audit.add_application(
+            source_term=info['source_term'],
+            target_term=target_term,
+            position=match.start() + offset,
+            original_text=placeholder
+        )
+        offset += len(replacement) - len(placeholder)
+        return replacement
+    
+    enforced_text = PLACEHOLDER_RE.sub(replace_placeholder, translated)
+    
+    audit.enforced_text = enforced_text
+    return enforced_text, audit
@@ -3,6 +3,41 @@
 import sys
 from pathlib import Path
 
+import httpx
+import pytest
+import pytest_asyncio
+
 # Add src to Python path for imports
 src_path = Path(__file__).parent.parent / "src"
 sys.path.insert(0, str(src_path))
+
+from src.config.env import get_settings
+
+
+@pytest.fixture
+def settings_env(monkeypatch):
+    """Set the required settings and clear the settings cache around a test."""
+    monkeypatch.setenv("AZURE_TRANSLATOR_KEY", "test-key")
+    monkeypatch.setenv("AZURE_TRANSLATOR_REGION", "westeurope")
+    get_settings.cache_clear()
+    yield monkeypatch
+    get_settings.cache_clear()
+
+
+@pytest_asyncio.fixture
+async def make_service(settings_env):
+    """Create services whose HTTP calls go to a mock transport.
+    
+    The factory takes the service class, a request handler and any extra
+    constructor arguments. Every service created is closed after the test.
+    """
+    services = []
+    
+    def factory(service_class, handler, **kwargs):
+        service = service_class(transport=httpx.MockTransport(handler), **kwargs)
+        services.append(service)
+        return service
+    
+    yield factory
+    for service in services:
+        await service.aclose()
@@ -3,7 +3,7 @@
 import pytest
 from src.terminology.glossary_loader import GlossaryEntry
 from src.terminology.enforcer import TerminologyEnforcer
-from src.terminology.audit import EnforcementAudit
+from src.terminology.audit import AuditCollector, EnforcementAudit
 
 
 class TestTerminologyEnforcer:
@@ -69,6 +69,39 @@ class TestTerminologyEnforcer:
         assert "probleem" in result
         assert "incident" in result
     
+    def test_case_preservation_single_uppercase_letter(self):
+        """Test that a one-letter uppercase match counts as upper case."""
+        enforcer = TerminologyEnforcer([GlossaryEntry("a", "een")])
+        
+        assert enforcer.enforce("plan A") == "plan EEN"
+    
+    def test_case_preservation_multiword_titlecase(self, overlapping_glossary):
+        """Test that a title-cased phrase gives a title-cased replacement."""
+        enforcer = TerminologyEnforcer(overlapping_glossary)
+        
+        assert enforcer.enforce("Critical Incident") == "Kritiek incident"
+    
+    def test_case_preservation_multiword_sentence_case(self, overlapping_glossary):
+        """Test that a sentence-cased phrase gives a capitalised replacement."""
+        enforcer = TerminologyEnforcer(overlapping_glossary)
+        
+        assert enforcer.enforce("Critical incident reported") == "Kritiek incident reported"
+        assert enforcer.enforce("Service desk is open") == "Servicedesk is open"
+    
+    def test_case_preservation_mixed_case_unchanged(self):
+        """Test that mixed-case matches keep the glossary target as-is."""
+        enforcer = TerminologyEnforcer([GlossaryEntry("iphone", "iPhone")])
+        
+        result = enforcer.enforce("Sync the iPhone today")
+        
+        assert result == "Sync the iPhone today"
+    
+    def test_case_preservation_uncased_unchanged(self):
+        """Test that matches without cased characters keep the target as-is."""
+        enforcer = TerminologyEnforcer([GlossaryEntry("365", "Office 365")])
+        
+        assert enforcer.enforce("Plan 365 today") == "Plan Office 365 today"
+    
     def test_word_boundaries(self, basic_glossary):
         """Test that replacements respect word boundaries."""
         enforcer = TerminologyEnforcer(basic_glossary)
@@ -155,6 +188,66 @@ class TestTerminologyEnforcer:
         assert "probleem" in term_targets
         assert "incident" in term_targets
     
+    def test_audit_positions(self, basic_glossary):
+        """Test that audit positions point at the replacements in the output."""
+        enforcer = TerminologyEnforcer(basic_glossary)
+        
+        text = "A change request for the problem"
+        audit = EnforcementAudit(original_text=text, enforced_text="")
+        
+        result = enforcer.enforce(text, audit)
+        
+        assert result == "A wijzigingsverzoek for the probleem"
+        for application in audit.applied_terms:
+            start = application.position
+            assert result[start:start + len(application.target_term)] == application.target_term
+    
+    def test_repeated_enforce_still_audits(self, basic_glossary):
+        """Test that cached enforcement does not skip audit recording."""
+        enforcer = TerminologyEnforcer(basic_glossary)
+        
+        text = "We have a problem"
+        first = enforcer.enforce(text)
+        audit = EnforcementAudit(original_text=text, enforced_text="")
+        second = enforcer.enforce(text, audit)
+        
+        assert first == second == "We have a probleem"
+        assert len(audit.applied_terms) == 1
+    
+    def test_cached_enforce_matches_uncached(self, basic_glossary):
+        """Test that cached results and audits match an uncached run."""
+        enforcer = TerminologyEnforcer(basic_glossary)
+        uncached = TerminologyEnforcer(basic_glossary)
+        
+        text = "The PROBLEM with the Incident and the service desk"
+        first = enforcer.enforce(text)
+        cached = enforcer.enforce(text)
+        assert enforcer._enforce_cached.cache_info().hits == 1
+        
+        cached_audit = EnforcementAudit(original_text=text, enforced_text="")
+        uncached_audit = EnforcementAudit(original_text=text, enforced_text="")
+        audited = enforcer.enforce(text, cached_audit)
+        expected = uncached._apply_terms(text, uncached_audit)
+        
+        assert first == cached == audited == expected
+        assert [
+            (app.source_term, app.target_term, app.position, app.original_text)
+            for app in cached_audit.applied_terms
+        ] == [
+            (app.source_term, app.target_term, app.position, app.original_text)
+            for app in uncached_audit.applied_terms
+        ]
+    
+    def test_enforce_long_text_not_cached(self, basic_glossary):
+        """Test that texts over the size limit bypass the enforce cache."""
+        enforcer = TerminologyEnforcer(basic_glossary)
+        
+        long_text = "problem " * (enforcer.MAX_CACHED_TEXT_LENGTH // 8 + 1)
+        result = enforcer.enforce(long_text)
+        
+        assert result == "probleem " * (enforcer.MAX_CACHED_TEXT_LENGTH // 8 + 1)
+        assert enforcer._enforce_cached.cache_info().currsize == 0
+    
     def test_multiword_terms(self, basic_glossary):
         """Test enforcement of multi-word terms."""
         enforcer = TerminologyEnforcer(basic_glossary)
@@ -192,6 +285,66 @@ class TestTerminologyEnforcer:
         assert "incident" in source_terms
         assert "problem" in source_terms
     
+    def test_get_applicable_terms_nested(self, overlapping_glossary):
+        """Test that terms nested inside longer terms are still applicable."""
+        enforcer = TerminologyEnforcer(overlapping_glossary)
+        
+        text = "A Critical Incident at the servicedesk"
+        applicable = enforcer.get_applicable_terms(text)
+        
+        # "service" is not word-bounded inside "servicedesk"
+        assert [entry.source for entry in applicable] == [
+            "critical incident",
+            "incident",
+        ]
+    
+    def test_find_terms_longest_match(self, overlapping_glossary):
+        """Test that find_terms prefers the longest overlapping term."""
+        enforcer = TerminologyEnforcer(overlapping_glossary)
+        
+        text = "A Critical Incident at the service desk"
+        matches = enforcer.find_terms(text)
+        
+        found = [(text[start:end], entry.source) for start, end, entry in matches]
+        assert found == [
+            ("Critical Incident", "critical incident"),
+            ("service desk", "service desk"),
+        ]
+    
+    def test_find_terms_leftmost_wins(self):
+        """Test that of two overlapping terms the one starting first wins."""
+        enforcer = TerminologyEnforcer([
+            GlossaryEntry("desk clerk", "baliemedewerker"),
+            GlossaryEntry("service desk", "servicedesk"),
+        ])
+        
+        text = "Ask the service desk clerk"
+        matches = enforcer.find_terms(text)
+        
+        assert [text[start:end] for start, end, _ in matches] == ["service desk"]
+    
+    def test_find_terms_word_boundaries(self, basic_glossary):
+        """Test that find_terms skips matches inside longer words."""
+        enforcer = TerminologyEnforcer(basic_glossary)
+        
+        text = "An incidental incident occurred"
+        matches = enforcer.find_terms(text)
+        
+        assert [(start, end) for start, end, _ in matches] == [(14, 22)]
+    
+    def test_find_terms_long_text_not_cached(self, basic_glossary):
+        """Test that texts over the size limit are scanned but not cached."""
+        enforcer = TerminologyEnforcer(basic_glossary)
+        
+        long_text = "problem " * (enforcer.MAX_CACHED_TEXT_LENGTH // 8 + 1)
+        matches = enforcer.find_terms(long_text)
+        
+        assert len(matches) == long_text.count("problem")
+        assert enforcer._find_terms_cached.cache_info().currsize == 0
+        
+        enforcer.find_terms("a problem")
+        assert enforcer._find_terms_cached.cache_info().currsize == 1
+    
     def test_no_double_replacement(self, basic_glossary):
         """Test that already-replaced terms are not replaced again."""
         enforcer = TerminologyEnforcer(basic_glossary)
@@ -216,6 +369,32 @@ class TestTerminologyEnforcer:
         
         assert "koffiehuis" in result
         assert "naïef" in result
+    
+    def test_length_changing_lowercase(self, basic_glossary):
+        """Test texts whose lowercase form has a different length."""
+        enforcer = TerminologyEnforcer(basic_glossary)
+        
+        # "İ".lower() is two code points, so offsets from text.lower() would drift
+        text = "İstanbul Service Desk INCIDENT"
+        result = enforcer.enforce(text)
+        
+        assert result == "İstanbul Servicedesk INCIDENT"
+    
+    def test_length_changing_lowercase_offsets(self, overlapping_glossary):
+        """Test that spans stay exact around characters that lowercase to two code points."""
+        enforcer = TerminologyEnforcer(overlapping_glossary)
+        
+        text = "İ Critical Incident İİ service İ"
+        
+        assert [(start, end, entry.source) for start, end, entry in enforcer.find_terms(text)] == [
+            (2, 19, "critical incident"),
+            (23, 30, "service"),
+        ]
+        assert [entry.source for entry in enforcer.get_applicable_terms(text)] == [
+            "critical incident",
+            "incident",
+            "service",
+        ]
 
 
 class TestGlossaryEntry:
@@ -268,3 +447,38 @@ class TestEnforcementAudit:
         assert summary['total_replacements'] == 2
         assert summary['unique_terms'] == 2
         assert len(summary['replacements']) == 2
+
+
+class TestAuditCollector:
+    """Test suite for AuditCollector."""
+    
+    def test_statistics_follow_evictions(self):
+        """Test that statistics only cover the audits still retained."""
+        collector = AuditCollector(max_audits=2)
+        
+        first = collector.create_audit("a", "a")
+        first.add_application("incident", "incident", 0, "incident")
+        first.add_application("problem", "probleem", 10, "problem")
+        collector.create_audit("b", "b").add_application("incident", "incident", 0, "incident")
+        collector.create_audit("c", "c")
+        
+        stats = collector.get_statistics()
+        
+        assert stats['total_audits'] == 2
+        assert stats['total_replacements'] == 1
+        assert stats['unique_terms_used'] == 1
+        assert [a.original_text for a in collector.get_recent_audits()] == ["b", "c"]
+    
+    def test_max_audits_must_be_positive(self):
+        """Test that a collector must keep at least one audit."""
+        with pytest.raises(ValueError):
+            AuditCollector(max_audits=0)
+    
+    def test_recent_audits_limit(self):
+        """Test that limit selects the newest audits and 0 returns all of them."""
+        collector = AuditCollector()
+        for text in "abc":
+            collector.create_audit(text, text)
+        
+        assert [a.original_text for a in collector.get_recent_audits(2)] == ["b", "c"]
+        assert [a.original_text for a in collector.get_recent_audits(0)] == ["a", "b", "c"]
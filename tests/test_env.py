@@ -0,0 +1,60 @@
+"""Unit tests for environment settings."""
+
+import pytest
+from src.config.env import get_settings
+
+
+class TestSettings:
+    """Test suite for Settings."""
+    
+    def test_glossary_cache_disabled_by_default(self, settings_env):
+        """Test that the glossary sidecar cache is opt-in."""
+        settings_env.delenv("GLOSSARY_CACHE_ENABLED", raising=False)
+        
+        assert get_settings().glossary_cache_enabled is False
+    
+    def test_glossary_cache_enabled(self, settings_env):
+        """Test that GLOSSARY_CACHE_ENABLED turns the cache on."""
+        settings_env.setenv("GLOSSARY_CACHE_ENABLED", "true")
+        
+        assert get_settings().glossary_cache_enabled is True
+    
+    @pytest.mark.parametrize("value, expected", [("NL", "nl"), ("De", "de"), (" fr ", "fr")])
+    def test_target_language_is_case_insensitive(self, settings_env, value, expected):
+        """Test that TARGET_LANGUAGE is stripped and lowercased before validation."""
+        settings_env.setenv("TARGET_LANGUAGE", value)
+        
+        assert get_settings().target_language == expected
+    
+    def test_unknown_target_language_rejected(self, settings_env):
+        """Test that an unsupported TARGET_LANGUAGE still fails validation."""
+        settings_env.setenv("TARGET_LANGUAGE", "xx")
+        
+        with pytest.raises(ValueError):
+            get_settings()
+    
+    def test_extra_translator_resources(self, settings_env):
+        """Test that extra Translator resources are parsed from JSON."""
+        settings_env.setenv(
+            "AZURE_TRANSLATOR_EXTRA_RESOURCES",
+            '[{"key": "k2", "region": "northeurope", "endpoint": "https://second.test"}]'
+        )
+        
+        resources = get_settings().azure_translator_extra_resources
+        
+        assert [(r.key, r.region, r.endpoint, r.category) for r in resources] == [
+            ("k2", "northeurope", "https://second.test", None)
+        ]
+    
+    def test_extra_translator_resources_default_empty(self, settings_env):
+        """Test that an empty value means no extra resources."""
+        settings_env.setenv("AZURE_TRANSLATOR_EXTRA_RESOURCES", "")
+        
+        assert get_settings().azure_translator_extra_resources == []
+    
+    def test_invalid_extra_translator_resources_rejected(self, settings_env):
+        """Test that malformed extra resources fail validation."""
+        settings_env.setenv("AZURE_TRANSLATOR_EXTRA_RESOURCES", '[{"key": "k2"}]')
+        
+        with pytest.raises(ValueError):
+            get_settings()
@@ -0,0 +1,231 @@
+"""Unit tests for the TSV glossary loader."""
+
+import os
+import orjson
+import pytest
+from src.terminology.enforcer import TerminologyEnforcer
+from src.terminology.glossary_loader import CACHE_SUFFIX, GlossaryLoader
+
+
+def write_glossary(path, rows):
+    """Write rows (lists of cells, or raw strings) as a TSV glossary."""
+    lines = [row if isinstance(row, str) else "\t".join(row) for row in rows]
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return path
+
+
+def pairs(entries):
+    """Get (source, target) tuples from glossary entries."""
+    return [(entry.source, entry.target) for entry in entries]
+
+
+class TestGlossaryLoader:
+    """Test suite for GlossaryLoader."""
+    
+    def test_single_file_sorted_longest_first(self, tmp_path):
+        """Test that entries are stripped and sorted by length, keeping file order on ties."""
+        path = write_glossary(tmp_path / "glossary.tsv", [
+            ["incident", "incident"],
+            ["  critical incident ", " kritiek incident "],
+            ["problem", "probleem"],
+            ["service", "dienst"],
+        ])
+        
+        entries = GlossaryLoader([path], use_cache=False).load()
+        
+        assert pairs(entries) == [
+            ("critical incident", "kritiek incident"),
+            ("incident", "incident"),
+            ("problem", "probleem"),
+            ("service", "dienst"),
+        ]
+    
+    def test_single_file_removes_repeated_pairs(self, tmp_path):
+        """Test that a repeated pair is kept once but a new target for a source is not dropped."""
+        path = write_glossary(tmp_path / "glossary.tsv", [
+            ["ticket", "melding"],
+            ["ticket", "melding"],
+            ["ticket", "ticket"],
+        ])
+        
+        entries = GlossaryLoader([path], use_cache=False).load()
+        
+        assert pairs(entries) == [("ticket", "melding"), ("ticket", "ticket")]
+    
+    def test_multi_file_matches_single_file(self, tmp_path):
+        """Test that several files load like one file holding their rows in path order."""
+        first = [["incident", "incident"], ["bug", "fout"], ["problem", "probleem"]]
+        second = [["bug", "fout"], ["change request", "wijzigingsverzoek"], ["bug", "defect"]]
+        paths = [
+            write_glossary(tmp_path / "a.tsv", first),
+            write_glossary(tmp_path / "b.tsv", second),
+        ]
+        combined = write_glossary(tmp_path / "combined.tsv", first + second)
+        
+        multi = GlossaryLoader(paths, use_cache=False).load()
+        single = GlossaryLoader([combined], use_cache=False).load()
+        
+        assert pairs(multi) == pairs(single)
+        assert pairs(multi) == [
+            ("change request", "wijzigingsverzoek"),
+            ("incident", "incident"),
+            ("problem", "probleem"),
+            ("bug", "fout"),
+            ("bug", "defect"),
+        ]
+    
+    def test_skips_empty_comment_and_blank_rows(self, tmp_path):
+        """Test that empty lines, comments and rows with a blank cell are skipped."""
+        path = write_glossary(tmp_path / "glossary.tsv", [
+            "# source\ttarget",
+            "",
+            ["   ", "leeg"],
+            "   ",
+            ["", "leeg"],
+            ["  # indented comment"],
+            ["release", "   "],
+            ["release", "release", "extra column"],
+        ])
+        
+        entries = GlossaryLoader([path], use_cache=False).load()
+        
+        assert pairs(entries) == [("release", "release")]
+    
+    def test_repeated_terms_are_shared(self, tmp_path):
+        """Test that equal terms from different rows are one string object."""
+        path = write_glossary(tmp_path / "glossary.tsv", [
+            ["bug", "fout"],
+            ["error", " fout"],
+        ])
+        
+        first, second = GlossaryLoader([path], use_cache=False).load()
+        
+        assert first.target is second.target
+    
+    def test_short_row_raises(self, tmp_path):
+        """Test that a row without a target column is reported with its line number."""
+        path = write_glossary(tmp_path / "glossary.tsv", [
+            ["incident", "incident"],
+            ["problem"],
+        ])
+        
+        with pytest.raises(ValueError, match="line 2"):
+            GlossaryLoader([path], use_cache=False).load()
+    
+    def test_missing_file_raises(self, tmp_path):
+        """Test that a missing glossary file raises FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            GlossaryLoader([tmp_path / "missing.tsv"], use_cache=False).load()
+        with pytest.raises(FileNotFoundError):
+            GlossaryLoader([], use_cache=False).load()
+    
+    def test_reload_leaves_existing_enforcer_intact(self, tmp_path):
+        """Test that reloading never changes the entries an enforcer was built from."""
+        path = write_glossary(tmp_path / "glossary.tsv", [
+            ["problem", "probleem"],
+            ["ticket", "ticket"],
+        ])
+        loader = GlossaryLoader([path], use_cache=False)
+        old_entries = loader.load()
+        enforcer = TerminologyEnforcer.from_loader(loader)
+        
+        write_glossary(path, [["ticket", "melding"], ["bug", "fout"]])
+        new_entries = loader.load()
+        
+        assert pairs(old_entries) == [("problem", "probleem"), ("ticket", "ticket")]
+        assert not set(map(id, old_entries)) & set(map(id, new_entries))
+        assert enforcer.enforce("a problem here, ticket") == "a probleem here, ticket"
+        assert pairs(enforcer.get_applicable_terms("a problem")) == [("problem", "probleem")]
+        
+        reloaded = TerminologyEnforcer.from_loader(loader)
+        assert reloaded.enforce("a problem here, ticket") == "a problem here, melding"
+    
+    def test_statistics(self, tmp_path):
+        """Test term count and length statistics."""
+        path = write_glossary(tmp_path / "glossary.tsv", [
+            ["bug", "fout"],
+            ["change request", "wijzigingsverzoek"],
+        ])
+        loader = GlossaryLoader([path], use_cache=False)
+        
+        assert loader.get_statistics()['total_terms'] == 0
+        
+        loader.load()
+        
+        assert loader.get_statistics() == {
+            "total_terms": 2, "longest_term": 14, "shortest_term": 3
+        }
+
+
+class TestGlossaryCache:
+    """Test suite for the opt-in parsed-column sidecar cache."""
+    
+    @pytest.fixture
+    def glossary(self, tmp_path):
+        """Create a small glossary file."""
+        return write_glossary(tmp_path / "glossary.tsv", [
+            ["incident", "incident"],
+            ["problem", "probleem"],
+        ])
+    
+    @staticmethod
+    def cache_path(path):
+        """Get the sidecar cache path of a glossary file."""
+        return path.with_name(path.name + CACHE_SUFFIX)
+    
+    def test_cache_is_opt_in(self, glossary):
+        """Test that no sidecar is written unless caching is enabled."""
+        GlossaryLoader([glossary]).load()
+        
+        assert not self.cache_path(glossary).exists()
+    
+    def test_cache_hit_skips_parse(self, glossary, monkeypatch):
+        """Test that a cache matching the file is used instead of re-parsing."""
+        first = GlossaryLoader([glossary], use_cache=True).load()
+        cached = orjson.loads(self.cache_path(glossary).read_bytes())
+        assert cached['sources'] == ["incident", "problem"]
+        
+        def fail_parse(path):
+            raise AssertionError("glossary was re-parsed")
+        
+        monkeypatch.setattr(GlossaryLoader, "_parse_columns", staticmethod(fail_parse))
+        second = GlossaryLoader([glossary], use_cache=True).load()
+        
+        assert pairs(second) == pairs(first)
+    
+    def test_stale_cache_is_refreshed(self, glossary):
+        """Test that editing the glossary invalidates its cache."""
+        GlossaryLoader([glossary], use_cache=True).load()
+        
+        write_glossary(glossary, [["ticket", "melding"]])
+        # Make sure the mtime changes even on coarse-grained filesystems
+        stat = glossary.stat()
+        os.utime(glossary, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+        entries = GlossaryLoader([glossary], use_cache=True).load()
+        
+        assert pairs(entries) == [("ticket", "melding")]
+        assert orjson.loads(self.cache_path(glossary).read_bytes())['sources'] == ["ticket"]
+    
+    @pytest.mark.parametrize("content", [
+        b"\x80\x04not json",
+        b"[1, 2, 3]",
+        b'{"key": "wrong"}',
+    ])
+    def test_corrupt_cache_is_ignored(self, glossary, content):
+        """Test that an unreadable or foreign cache falls back to parsing."""
+        self.cache_path(glossary).write_bytes(content)
+        
+        entries = GlossaryLoader([glossary], use_cache=True).load()
+        
+        assert pairs(entries) == [("incident", "incident"), ("problem", "probleem")]
+    
+    def test_malformed_columns_are_ignored(self, glossary):
+        """Test that a cache with the right key but bad columns falls back to parsing."""
+        GlossaryLoader([glossary], use_cache=True).load()
+        cache_path = self.cache_path(glossary)
+        cached = orjson.loads(cache_path.read_bytes())
+        
+        for columns in ({'sources': [1, 2]}, {'targets': ["x"]}, {'sources': None}):
+            cache_path.write_bytes(orjson.dumps({**cached, **columns}))
+            entries = GlossaryLoader([glossary], use_cache=True).load()
+            assert pairs(entries) == [("incident", "incident"), ("problem", "probleem")]
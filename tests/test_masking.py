@@ -0,0 +1,88 @@
+"""Unit tests for glossary placeholder masking."""
+
+import pytest
+from src.terminology.glossary_loader import GlossaryEntry
+from src.terminology.enforcer import TerminologyEnforcer
+from src.terminology.masking import apply_case, mask_terms, unmask_terms
+
+
+class TestMasking:
+    """Test suite for mask_terms / unmask_terms."""
+    
+    @pytest.fixture
+    def enforcer(self):
+        """Create an enforcer with overlapping glossary terms."""
+        return TerminologyEnforcer([
+            GlossaryEntry("critical incident", "kritiek incident"),
+            GlossaryEntry("service desk", "servicedesk"),
+            GlossaryEntry("incident", "incident"),
+            GlossaryEntry("problem", "probleem"),
+        ])
+    
+    def test_mask_replaces_terms_with_placeholders(self, enforcer):
+        """Test that every glossary term is replaced by a placeholder."""
+        masked, placeholder_map = mask_terms(
+            "A critical incident at the service desk", enforcer
+        )
+        
+        assert "incident" not in masked
+        assert "service desk" not in masked
+        assert len(placeholder_map) == 2
+        assert all(placeholder in masked for placeholder in placeholder_map)
+    
+    def test_mask_without_terms(self, enforcer):
+        """Test that text without glossary terms is returned unchanged."""
+        masked, placeholder_map = mask_terms("Nothing to see here", enforcer)
+        
+        assert masked == "Nothing to see here"
+        assert placeholder_map == {}
+    
+    def test_mask_keeps_original_spelling(self, enforcer):
+        """Test that the placeholder map keeps the term as written in the source."""
+        masked, placeholder_map = mask_terms("Call the SERVICE Desk", enforcer)
+        
+        assert masked == "Call the __GLOSS_0__"
+        assert placeholder_map["__GLOSS_0__"]["original_case"] == "SERVICE Desk"
+    
+    def test_round_trip_preserves_case(self, enforcer):
+        """Test that unmasking applies target terms in the source casing."""
+        masked, placeholder_map = mask_terms("PROBLEM with the Service Desk", enforcer)
+        
+        enforced, audit = unmask_terms(masked, placeholder_map)
+        
+        assert enforced == "PROBLEEM with the Servicedesk"
+        assert len(audit.applied_terms) == 2
+        assert audit.enforced_text == enforced
+    
+    def test_unmask_records_positions(self, enforcer):
+        """Test that the audit records where each term was inserted."""
+        masked, placeholder_map = mask_terms("problem", enforcer)
+        
+        enforced, audit = unmask_terms(f"Het {masked}", placeholder_map)
+        
+        assert enforced == "Het probleem"
+        assert audit.applied_terms[0].position == 4
+    
+    def test_unmask_positions_follow_earlier_replacements(self, enforcer):
+        """Test that audit positions account for earlier, longer replacements."""
+        masked, placeholder_map = mask_terms("problem and incident", enforcer)
+        
+        enforced, audit = unmask_terms(masked, placeholder_map)
+        
+        assert enforced == "probleem and incident"
+        for application in audit.applied_terms:
+            start = application.position
+            assert enforced[start:start + len(application.target_term)] == application.target_term
+
+
+class TestApplyCase:
+    """Test suite for apply_case."""
+    
+    @pytest.mark.parametrize("sample, expected", [
+        ("SERVICE DESK", "SERVICEDESK"),
+        ("Service desk", "Servicedesk"),
+        ("service desk", "servicedesk"),
+    ])
+    def test_case_patterns(self, sample, expected):
+        """Test upper, capitalised and lower case samples."""
+        assert apply_case("servicedesk", sample) == expected
@@ -0,0 +1,164 @@
+"""Unit tests for the Azure OpenAI post-editor."""
+
+import asyncio
+from functools import partial
+import httpx
+import orjson
+import pytest
+from src.services.post_editor import PostEditor
+
+
+def chat_response(content: str) -> httpx.Response:
+    """Build a chat completion response with the given message content."""
+    return httpx.Response(200, json={'choices': [{'message': {'content': content}}]})
+
+
+@pytest.fixture
+def make_editor(settings_env, make_service):
+    """Create post-editors whose HTTP calls go to a mock transport."""
+    settings_env.setenv("ENABLE_POST_EDITOR", "true")
+    settings_env.setenv("AZURE_OPENAI_ENDPOINT", "https://openai.test")
+    settings_env.setenv("AZURE_OPENAI_KEY", "openai-key")
+    return partial(make_service, PostEditor)
+
+
+class TestPostEditBatch:
+    """Test suite for post_edit_batch and its segment splitting."""
+    
+    @pytest.mark.asyncio
+    async def test_batch_uses_single_request(self, make_editor):
+        """Test that segments are sent together and split back in order."""
+        prompts = []
+        
+        def handler(request):
+            prompt = orjson.loads(request.content)['messages'][1]['content']
+            prompts.append(prompt)
+            return chat_response("§§§0§§§\nEerste zin.\n§§§1§§§\nTweede zin.")
+        
+        editor = make_editor(handler)
+        result = await editor.post_edit_batch(["eerste zin", "tweede zin"])
+        
+        assert result == ["Eerste zin.", "Tweede zin."]
+        assert len(prompts) == 1
+        assert "§§§0§§§\neerste zin\n§§§1§§§\ntweede zin" in prompts[0]
+    
+    @pytest.mark.asyncio
+    async def test_batch_falls_back_on_missing_markers(self, make_editor):
+        """Test that an unsplittable response falls back to per-item calls."""
+        calls = []
+        
+        def handler(request):
+            prompt = orjson.loads(request.content)['messages'][1]['content']
+            calls.append(prompt)
+            if len(calls) == 1:
+                return chat_response("Alles in een keer.")
+            return chat_response(prompt.upper())
+        
+        editor = make_editor(handler)
+        result = await editor.post_edit_batch(["een", "twee"])
+        
+        assert result == ["EEN", "TWEE"]
+        assert len(calls) == 3
+    
+    @pytest.mark.asyncio
+    async def test_batch_with_marker_in_input(self, make_editor):
+        """Test that input containing a marker is never batched."""
+        prompts = []
+        
+        def handler(request):
+            prompt = orjson.loads(request.content)['messages'][1]['content']
+            prompts.append(prompt)
+            return chat_response(prompt)
+        
+        editor = make_editor(handler)
+        texts = ["zie §§§1§§§ hieronder", "tweede"]
+        result = await editor.post_edit_batch(texts)
+        
+        assert result == texts
+        assert sorted(prompts) == sorted(texts)
+    
+    def test_split_segments(self, make_editor):
+        """Test splitting on markers, in index order."""
+        editor = make_editor(lambda request: chat_response(""))
+        
+        assert editor._split_segments("§§§1§§§\nb\n§§§0§§§\na\n", 2) == ["a", "b"]
+        assert editor._split_segments("§§§0§§§\na", 2) is None
+        assert editor._split_segments("§§§0§§§\na\n§§§2§§§\nc", 2) is None
+
+
+class TestBatchApi:
+    """Test suite for the Azure OpenAI Batch API methods."""
+    
+    @staticmethod
+    def batch_handler(editor_ref, statuses, seen):
+        """Build a handler that emulates the files and batches endpoints."""
+        def handler(request):
+            # Every Batch API call goes through the client semaphore
+            assert editor_ref[0]._semaphore.locked()
+            seen.append((request.method, request.url.path))
+            path = request.url.path
+            
+            if path == '/openai/files':
+                assert b'purpose' in request.content
+                return httpx.Response(200, json={'id': 'file-in'})
+            if path == '/openai/batches':
+                body = orjson.loads(request.content)
+                assert body['input_file_id'] == 'file-in'
+                assert request.headers['Content-Type'] == 'application/json'
+                return httpx.Response(200, json={'id': 'batch-1'})
+            if path == '/openai/batches/batch-1':
+                status = statuses.pop(0)
+                return httpx.Response(200, json={
+                    'id': 'batch-1', 'status': status, 'output_file_id': 'file-out'
+                })
+            if path == '/openai/files/file-out/content':
+                lines = [
+                    {'custom_id': '1', 'response': {'status_code': 200, 'body': {
+                        'choices': [{'message': {'content': ' Twee. '}}]}}},
+                    {'custom_id': '0', 'response': {'status_code': 500, 'body': {}}},
+                ]
+                return httpx.Response(200, content=b"\n".join(map(orjson.dumps, lines)))
+            return httpx.Response(404)
+        
+        return handler
+    
+    @pytest.fixture
+    def editor_with(self, make_editor):
+        """Create an editor limited to one in-flight request."""
+        def factory(statuses, seen):
+            editor_ref = []
+            editor = make_editor(self.batch_handler(editor_ref, statuses, seen))
+            editor._semaphore = asyncio.Semaphore(1)
+            editor_ref.append(editor)
+            return editor
+        
+        return factory
+    
+    @pytest.mark.asyncio
+    async def test_submit_batch_job(self, editor_with):
+        """Test that the JSONL file is uploaded before the job is created."""
+        seen = []
+        editor = editor_with([], seen)
+        
+        assert await editor.submit_batch_job(["een", "twee"]) == 'batch-1'
+        assert seen == [('POST', '/openai/files'), ('POST', '/openai/batches')]
+    
+    @pytest.mark.asyncio
+    async def test_post_edit_jsonl(self, editor_with):
+        """Test polling until completion and merging results by custom_id."""
+        seen = []
+        editor = editor_with(['in_progress', 'completed'], seen)
+        
+        result = await editor.post_edit_jsonl(["een", "twee"], poll_interval=0)
+        
+        # Failed items keep their original text
+        assert result == ["een", "Twee."]
+        assert seen.count(('GET', '/openai/batches/batch-1')) == 2
+    
+    @pytest.mark.asyncio
+    async def test_post_edit_jsonl_failed_job(self, editor_with):
+        """Test that a job ending in a non-completed state raises."""
+        editor = editor_with(['failed'], [])
+        
+        with pytest.raises(RuntimeError, match="failed"):
+            await editor.post_edit_jsonl(["een"], poll_interval=0)
@@ -0,0 +1,134 @@
+"""Unit tests for client-side rate limiting and retries."""
+
+import httpx
+import pytest
+from src.services import rate_limit
+from src.services.rate_limit import RateLimiter, retry_delay, send_with_retry
+
+
+class SleepRecorder:
+    """Sleep function that records requested delays instead of waiting."""
+    
+    def __init__(self):
+        self.delays = []
+    
+    async def __call__(self, delay):
+        self.delays.append(delay)
+
+
+@pytest.fixture
+def sleep():
+    """Create a sleep recorder to inject into the code under test."""
+    return SleepRecorder()
+
+
+def responder(*responses):
+    """Build a send callable that returns the given responses in turn."""
+    queue = list(responses)
+    calls = []
+    
+    async def send():
+        calls.append(len(calls))
+        return queue.pop(0)
+    
+    return send, calls
+
+
+class TestRetryDelay:
+    """Test suite for retry_delay."""
+    
+    def test_uses_retry_after_seconds(self):
+        """Test that a numeric Retry-After header is honoured."""
+        response = httpx.Response(429, headers={'Retry-After': '3'})
+        
+        assert retry_delay(response, 0) == 3.0
+    
+    def test_retry_after_is_capped(self):
+        """Test that Retry-After is clamped to MAX_RETRY_DELAY."""
+        response = httpx.Response(429, headers={'Retry-After': '3600'})
+        
+        assert retry_delay(response, 0) == rate_limit.MAX_RETRY_DELAY
+    
+    def test_http_date_falls_back_to_backoff(self):
+        """Test that an HTTP-date Retry-After uses exponential backoff."""
+        response = httpx.Response(
+            503, headers={'Retry-After': 'Wed, 21 Oct 2015 07:28:00 GMT'}
+        )
+        
+        assert retry_delay(response, 2) == 4.0
+    
+    def test_backoff_without_header(self):
+        """Test exponential backoff and its cap when no header is sent."""
+        response = httpx.Response(503)
+        
+        assert [retry_delay(response, n) for n in range(3)] == [1.0, 2.0, 4.0]
+        assert retry_delay(response, 10) == rate_limit.MAX_RETRY_DELAY
+
+
+class TestSendWithRetry:
+    """Test suite for send_with_retry."""
+    
+    @pytest.mark.asyncio
+    async def test_retries_throttled_responses(self, sleep):
+        """Test that 429 and 503 are retried after the Retry-After wait."""
+        send, calls = responder(
+            httpx.Response(429, headers={'Retry-After': '2'}),
+            httpx.Response(503, headers={'Retry-After': '5'}),
+            httpx.Response(200)
+        )
+        
+        response = await send_with_retry(send, RateLimiter(), max_retries=3, sleep=sleep)
+        
+        assert response.status_code == 200
+        assert len(calls) == 3
+        assert sleep.delays == [2.0, 5.0]
+    
+    @pytest.mark.asyncio
+    async def test_other_errors_are_not_retried(self, sleep):
+        """Test that a non-retryable error is returned at once."""
+        send, calls = responder(httpx.Response(500))
+        
+        response = await send_with_retry(send, RateLimiter(), max_retries=3, sleep=sleep)
+        
+        assert response.status_code == 500
+        assert len(calls) == 1
+        assert sleep.delays == []
+    
+    @pytest.mark.asyncio
+    async def test_returns_last_response_when_exhausted(self, sleep):
+        """Test that the last throttled response is returned after max_retries."""
+        send, calls = responder(*[httpx.Response(503) for _ in range(3)])
+        
+        response = await send_with_retry(send, RateLimiter(), max_retries=2, sleep=sleep)
+        
+        assert response.status_code == 503
+        assert len(calls) == 3
+        assert sleep.delays == [1.0, 2.0]
+
+
+class TestRateLimiter:
+    """Test suite for RateLimiter."""
+    
+    @pytest.mark.asyncio
+    async def test_spaces_request_starts(self, sleep):
+        """Test that consecutive requests wait for successive slots."""
+        limiter = RateLimiter(rate=10, sleep=sleep)
+        
+        for _ in range(3):
+            async with limiter:
+                pass
+        
+        assert len(sleep.delays) == 2
+        assert sleep.delays[0] == pytest.approx(0.1, abs=0.01)
+        assert sleep.delays[1] == pytest.approx(0.2, abs=0.01)
+    
+    @pytest.mark.asyncio
+    async def test_zero_rate_is_unlimited(self, sleep):
+        """Test that a rate of 0 never sleeps."""
+        limiter = RateLimiter(rate=0, sleep=sleep)
+        
+        for _ in range(5):
+            async with limiter:
+                pass
+        
+        assert sleep.delays == []
@@ -0,0 +1,210 @@
+"""Unit tests for the Azure Translator client."""
+
+import asyncio
+from functools import partial
+import httpx
+import orjson
+import pytest
+from src.services.translator import TranslatorClient, TranslatorPool
+
+
+def echo_translations(request: httpx.Request) -> httpx.Response:
+    """Answer a translate request by upper-casing every input text."""
+    body = orjson.loads(request.content)
+    return httpx.Response(200, json=[
+        {'translations': [{'text': item['text'].upper(), 'to': 'nl'}]}
+        for item in body
+    ])
+
+
+@pytest.fixture
+def make_client(settings_env, make_service):
+    """Create translator clients whose HTTP calls go to a mock transport."""
+    settings_env.setenv("AZURE_TRANSLATOR_MAX_RETRIES", "0")
+    return partial(make_service, TranslatorClient)
+
+
+class TestTranslateBatch:
+    """Test suite for TranslatorClient.translate_batch."""
+    
+    @pytest.mark.asyncio
+    async def test_batches_respect_item_and_char_limits(self, make_client):
+        """Test that texts are grouped by item count and character total."""
+        sizes = []
+        
+        def handler(request):
+            sizes.append(len(orjson.loads(request.content)))
+            return echo_translations(request)
+        
+        client = make_client(handler)
+        texts = ["aa", "bb", "cc", "dddddddddd", "ee"]
+        
+        results = await client.translate_batch(texts, "de", max_items=2, max_chars=10)
+        
+        # "dddddddddd" alone fills the character budget
+        assert sizes == [2, 1, 1, 1]
+        assert [r['translated_text'] for r in results] == [t.upper() for t in texts]
+    
+    @pytest.mark.asyncio
+    async def test_results_keep_input_order(self, make_client):
+        """Test that results line up with the input texts and parameters."""
+        params = []
+        
+        def handler(request):
+            params.append(dict(request.url.params))
+            return echo_translations(request)
+        
+        client = make_client(handler, category="cat-1")
+        texts = [f"text {i}" for i in range(7)]
+        
+        results = await client.translate_batch(texts, "fr", target_language="de", max_items=3)
+        
+        assert [r['translated_text'] for r in results] == [t.upper() for t in texts]
+        assert all(r['category_used'] == "cat-1" for r in results)
+        assert params[0] == {
+            'api-version': '3.0', 'category': 'cat-1', 'allowFallback': 'false',
+            'from': 'fr', 'to': 'de'
+        }
+    
+    @pytest.mark.asyncio
+    async def test_http_error_raises(self, make_client):
+        """Test that an error status from the API is raised."""
+        client = make_client(lambda request: httpx.Response(400, json={'error': {}}))
+        
+        with pytest.raises(httpx.HTTPStatusError):
+            await client.translate_batch(["a", "b"], "de")
+    
+    @pytest.mark.asyncio
+    async def test_mismatched_response_raises(self, make_client):
+        """Test that a response with the wrong number of items is rejected."""
+        def handler(request):
+            return httpx.Response(200, json=[{'translations': [{'text': "A"}]}])
+        
+        client = make_client(handler)
+        
+        with pytest.raises(ValueError):
+            await client.translate_batch(["a", "b"], "de")
+
+
+class TestTranslateMany:
+    """Test suite for TranslatorClient.translate_many."""
+    
+    @pytest.mark.asyncio
+    async def test_splits_into_batches(self, make_client):
+        """Test that texts are sent in batches of batch_size."""
+        sizes = []
+        
+        def handler(request):
+            sizes.append(len(orjson.loads(request.content)))
+            return echo_translations(request)
+        
+        client = make_client(handler)
+        
+        await client.translate_many([f"t{i}" for i in range(7)], "de", batch_size=3)
+        
+        assert sorted(sizes) == [1, 3, 3]
+    
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self, make_client):
+        """Test that batches run concurrently, up to the client capacity."""
+        in_flight = 0
+        peak = 0
+        
+        async def handler(request):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return echo_translations(request)
+        
+        client = make_client(handler, max_concurrent=2)
+        
+        await client.translate_many([f"t{i}" for i in range(10)], "de", batch_size=1)
+        
+        assert peak == 2
+    
+    @pytest.mark.asyncio
+    async def test_results_keep_input_order(self, make_client):
+        """Test that results follow the input even when later batches finish first."""
+        async def handler(request):
+            body = orjson.loads(request.content)
+            # The first batch is the slowest to answer
+            await asyncio.sleep(0.02 if body[0]['text'] == "t0" else 0)
+            return echo_translations(request)
+        
+        client = make_client(handler)
+        texts = [f"t{i}" for i in range(6)]
+        
+        results = await client.translate_many(texts, "de", batch_size=2)
+        
+        assert [r['translated_text'] for r in results] == [t.upper() for t in texts]
+
+
+class TestTranslatorPool:
+    """Test suite for TranslatorPool."""
+    
+    def test_lease_picks_least_loaded_client(self, make_client):
+        """Test that leases go to the client with the lowest share of capacity in use."""
+        small = make_client(echo_translations, endpoint="https://small.test", max_concurrent=1)
+        large = make_client(echo_translations, endpoint="https://large.test", max_concurrent=4)
+        pool = TranslatorPool([small, large])
+        
+        with pool._lease() as first, pool._lease() as second, pool._lease() as third:
+            # small is full after one lease, large stays below it at 2/4
+            assert (first, second, third) == (small, large, large)
+            assert pool.get_load() == {'small.test': 1, 'large.test': 2}
+            
+            with pool._lease() as fourth:
+                assert fourth is large
+        
+        assert pool.get_load() == {'small.test': 0, 'large.test': 0}
+    
+    def test_empty_pool_rejected(self):
+        """Test that a pool needs at least one client."""
+        with pytest.raises(ValueError):
+            TranslatorPool([])
+    
+    @pytest.mark.asyncio
+    async def test_translate_many_spreads_batches(self, make_client):
+        """Test that batches are spread over the pool and keep input order."""
+        hosts = []
+        
+        async def handler(request):
+            hosts.append(request.url.host)
+            await asyncio.sleep(0.01)
+            return echo_translations(request)
+        
+        clients = [
+            make_client(handler, endpoint=f"https://{name}.test", max_concurrent=2)
+            for name in ("a", "b")
+        ]
+        pool = TranslatorPool(clients)
+        texts = [f"t{i}" for i in range(4)]
+        
+        results = await pool.translate_many(texts, "de", batch_size=1)
+        
+        assert [r['translated_text'] for r in results] == [t.upper() for t in texts]
+        assert sorted(hosts) == ["a.test", "a.test", "b.test", "b.test"]
+    
+    @pytest.mark.asyncio
+    async def test_aclose_closes_every_client(self, make_client):
+        """Test that shutdown closes all clients, even when one fails to close."""
+        clients = [
+            make_client(echo_translations, endpoint=f"https://{name}.test")
+            for name in ("a", "b", "c")
+        ]
+        
+        async def failing_close():
+            raise RuntimeError("close failed")
+        
+        clients[0].aclose = failing_close
+        pool = TranslatorPool(clients)
+        
+        with pytest.raises(RuntimeError, match="close failed"):
+            await pool.aclose()
+        
+        assert clients[1]._client.is_closed
+        assert clients[2]._client.is_closed
+        # Let the fixture close the first client normally
+        del clients[0].aclose